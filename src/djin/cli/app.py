@@ -20,19 +20,77 @@ from djin.__version__ import __version__ as VERSION
 # Import the command router and core command registration (if you create one)
 from djin.cli.commands import exit_command, help_command, register_command, route_command
 
-# Import the registration functions from feature modules
-from djin.features.accounting.commands import register_accounting_commands # Added import
-from djin.features.notes.commands import add_note_command, register_note_commands
-
-# Import database initialization if you want to do it once at startup
-from djin.features.notes.db.schema import init_database as init_notes_db
-from djin.features.orchestrator.commands import register_orchestrator_commands
-from djin.features.tasks.commands import register_task_commands
-from djin.features.textsynth.commands import register_textsynth_commands
-
-# Import other feature command registration functions here as you create them
-
-# Import other initializers if needed
+from djin.features.orchestrator.customers import CUSTOMERS
+
+# Feature commands are registered as "module:attr" strings, so a feature module (and the Jira,
+# LLM, browser and DB layers behind it) is only imported when one of its commands is first run
+_VALID_CUSTOMERS = "|".join(CUSTOMERS.keys())
+FEATURE_COMMANDS = [
+    # Notes
+    ("note", "djin.features.notes.commands:note_command", "Manage notes (add, list, view, delete)"),
+    ("note add", "djin.features.notes.commands:add_note_command", "Add a new note"),
+    ("note list", "djin.features.notes.commands:list_notes_command", "List all notes"),
+    ("note view", "djin.features.notes.commands:view_note_command", "View a specific note by ID"),
+    ("note delete", "djin.features.notes.commands:delete_note_command", "Delete a note by ID"),
+    ("note debug", "djin.features.notes.commands:debug_notes_db_command", "Debug the notes database"),
+    # Tasks
+    ("tasks todo", "djin.features.tasks.commands:todo_command", "Show your Jira issues in To Do status"),
+    ("tasks active", "djin.features.tasks.commands:active_command", "Show all your active Jira issues"),
+    (
+        "tasks worked-on",
+        "djin.features.tasks.commands:worked_on_command",
+        "Show Jira issues you worked on for a specific date (YYYY-MM-DD, default: today)",
+    ),
+    (
+        "tasks completed",
+        "djin.features.tasks.commands:completed_command",
+        "Show your completed Jira issues (default: last 7 days)",
+    ),
+    (
+        "tasks",
+        "djin.features.tasks.commands:task_details_command",
+        "Show details for a specific Jira issue (e.g., /tasks PROJ-123)",
+    ),
+    (
+        "tasks set-status",
+        "djin.features.tasks.commands:set_task_status_command",
+        "Set the status of a Jira issue (e.g., /tasks set-status PROJ-123 'In Progress')",
+    ),
+    (
+        "tasks create",
+        "djin.features.tasks.commands:create_ticket_command",
+        "Create a new Jira ticket in AION MEDIA GROUP (e.g., /tasks create \"Summary\" \"Description\")",
+    ),
+    # Text synthesis
+    (
+        "summarize",
+        "djin.features.textsynth.commands:summarize_titles_command",
+        "Summarize multiple Jira issue titles. Usage: /summarize 'Title 1' 'Title 2' ...",
+    ),
+    # Orchestrator
+    ("overview", "djin.features.orchestrator.commands:overview_command", "Show an overview of your tasks"),
+    (
+        "work-summary",
+        "djin.features.orchestrator.commands:work_summary_command",
+        f"Generate a work summary (Usage: /work-summary [YYYY-MM-DD] <{_VALID_CUSTOMERS}>)",
+    ),
+    (
+        "register-time",
+        "djin.features.orchestrator.commands:register_time_command",
+        f"Register time with auto-generated summary (Usage: /register-time [YYYY-MM-DD] <{_VALID_CUSTOMERS}> [hours])",
+    ),
+    # Accounting
+    (
+        "accounting login",
+        "djin.features.accounting.commands:login_command",
+        "Open browser and login to MoneyMonk (Usage: /accounting login [--headless]).",
+    ),
+    (
+        "accounting register-hours",
+        "djin.features.accounting.commands:register_hours_command",
+        "Register hours on MoneyMonk (Usage: /accounting register-hours YYYY-MM-DD hours description [--headless]).",
+    ),
+]
 
 # Create console for rich output
 console = Console()
@@ -117,18 +175,17 @@ def register_all_commands():
     register_command("exit", exit_command, "Exit Djin")
     register_command("quit", exit_command, "Alias for exit")
 
-    # Register feature commands
-    register_note_commands()
-    register_task_commands()
-    register_textsynth_commands()
-    register_orchestrator_commands()
-    register_accounting_commands() # Added call
+    # Register feature commands; their modules are imported on first use
+    for name, handler, help_text in FEATURE_COMMANDS:
+        register_command(name, handler, help_text)
 
     logger.info("All commands registered.")
 
 
 def initialize_features():
     """Initialize features like databases."""
+    from djin.features.notes.db.schema import init_database as init_notes_db
+
     logger.info("Initializing features...")
     try:
         init_notes_db()
@@ -184,8 +241,8 @@ def main_loop():
             else:
                 # Handle plain text (add as note)
                 console.print("[cyan]Adding note:[/cyan]", text)  # Give feedback
-                # Pass the text as a list of arguments to the command function
-                add_note_command([text])
+                # Pass the text as a list of arguments to the "note add" command
+                route_command("note add", [text])
 
         except KeyboardInterrupt:
             # Handle Ctrl+C
@@ -2,6 +2,7 @@
 Command routing system for Djin.
 """
 
+import importlib
 import logging
 
 from rich.console import Console
@@ -19,10 +20,31 @@ commands = {}
 logger.info("Initializing command registry")
 
 
+def _describe(func):
+    """Return 'module.name' for a handler, or the 'module:attr' spec if it is not loaded yet."""
+    return func if isinstance(func, str) else f"{func.__module__}.{func.__name__}"
+
+
 def register_command(name, func, help_text):
-    """Register a command with the command system."""
+    """
+    Register a command with the command system.
+
+    func is either the handler itself or a "module:attr" string; a string is only imported
+    when the command is first run, so registering it does not load the feature module.
+    """
     commands[name] = {"func": func, "help": help_text}
-    logger.info(f"Registered command: {name} -> {func.__module__}.{func.__name__}")
+    logger.info(f"Registered command: {name} -> {_describe(func)}")
+
+
+def _get_handler(name):
+    """Return the handler for a registered command, importing it on first use."""
+    func = commands[name]["func"]
+    if isinstance(func, str):
+        module_name, attr = func.split(":")
+        func = getattr(importlib.import_module(module_name), attr)
+        # Later calls use the resolved handler directly
+        commands[name]["func"] = func
+    return func
 
 
 def route_command(cmd_name: str, args: list[str]):
@@ -36,11 +58,11 @@ def route_command(cmd_name: str, args: list[str]):
     if potential_subcommand and potential_subcommand in commands:
         # It's a subcommand (e.g., "tasks todo")
         logger.info(f"Found subcommand: '{potential_subcommand}', routing with args: {args[1:]}")
-        return commands[potential_subcommand]["func"](args[1:])
+        return _get_handler(potential_subcommand)(args[1:])
     elif cmd_name in commands:
         # It's a base command with potential arguments (e.g., "tasks JIR-123" or just "tasks")
         logger.info(f"Found base command: '{cmd_name}', routing with args: {args}")
-        return commands[cmd_name]["func"](args)
+        return _get_handler(cmd_name)(args)
     else:
         # Command not found
         logger.warning(f"Unknown command: '{cmd_name}'")
@@ -122,7 +144,7 @@ def debug_commands(args):
     table.add_column("Function")
 
     for cmd_name, cmd_info in sorted(commands.items()):
-        table.add_row(f"/{cmd_name}", cmd_info["help"], f"{cmd_info['func'].__module__}.{cmd_info['func'].__name__}")
+        table.add_row(f"/{cmd_name}", cmd_info["help"], _describe(cmd_info["func"]))
 
     console.print(table)
     return True
@@ -0,0 +1,77 @@
+"""
+In-process caching utilities for Djin.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """A thread-safe dict cache whose entries expire after ttl seconds, bounded to maxsize entries."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling fetch() on a miss or after expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = fetch()
+
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                # Drop expired entries first; if still full, evict the oldest insertion
+                for stale_key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[stale_key]
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove all entries whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one; later callers wait for the first call's result."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn() for key unless a call for key is already in flight, and return its result."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
@@ -2,6 +2,7 @@
 Configuration management for Djin.
 """
 
+import functools
 import json
 import os
 import pathlib
@@ -21,6 +22,10 @@ DEFAULT_CONFIG = {
         "url": "",
         "username": "",
         "api_token": "",
+        # Set to true when the Jira instance has ScriptRunner, enabling issueFunction JQL
+        "scriptrunner": False,
+        # Number of search result pages fetched concurrently
+        "async_workers": 5,
     },
     "moneymonk": {
         "url": "https://moneymonk.com",
@@ -109,6 +114,9 @@ def save_config(config):
     with open(CONFIG_FILE, "w") as f:
         json.dump(safe_config, f, indent=2)
 
+    # The configuration changed, so the next is_configured() check must run again
+    is_configured.cache_clear()
+
 
 def setup_config():
     """Interactive setup for configuration."""
@@ -127,6 +135,13 @@ def setup_config():
         if new_token:
             config["jira"]["api_token"] = new_token
 
+    # Existing config files predate this option, so default to off
+    current_scriptrunner = "y" if config["jira"].get("scriptrunner") else "n"
+    scriptrunner = input(
+        f"Does your Jira have ScriptRunner (enables searching for issues you commented on)? (y/n) [{current_scriptrunner}]: "
+    )
+    config["jira"]["scriptrunner"] = (scriptrunner.strip().lower() or current_scriptrunner) in ("y", "yes")
+
     # MoneyMonk configuration
     console.print("\n[bold]MoneyMonk Configuration[/bold]")
     config["moneymonk"]["username"] = (
@@ -149,8 +164,9 @@ def setup_config():
     console.print("\n[green]Configuration saved![/green]")
 
 
+@functools.lru_cache(maxsize=1)
 def is_configured():
-    """Check if the application is configured."""
+    """Check if the application is configured; memoized for the rest of the process."""
     config = load_config()
 
     jira_configured = (
@@ -175,4 +191,4 @@ def is_configured():
         )
     )
 
-    return jira_configured and moneymonk_configured
+    return bool(jira_configured and moneymonk_configured)
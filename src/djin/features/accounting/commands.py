@@ -10,7 +10,6 @@ from loguru import logger  # Import Loguru logger
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError  # Import the specific exception
 from rich.console import Console
 
-from djin.cli.commands import register_command
 from djin.common.errors import (  # Added MoneyMonkError, ConfigurationError
     ConfigurationError,
     DjinError,
@@ -132,24 +131,3 @@ def register_hours_command(args: List[str]) -> bool:
         # Wrap in DjinError for consistent handling
         handle_error(DjinError(f"An unexpected error occurred during hour registration: {str(e)}"))
         return False
-
-
-# --- Registration Function ---
-
-
-def register_accounting_commands():
-    """Registers all commands related to the accounting feature."""
-    commands_to_register = {
-        "accounting login": (
-            login_command,
-            "Open browser and login to MoneyMonk (Usage: /accounting login [--headless]).",
-        ),
-        "accounting register-hours": (
-            register_hours_command,
-            "Register hours on MoneyMonk (Usage: /accounting register-hours YYYY-MM-DD hours description [--headless]).",
-        ),
-        # Add other accounting commands here
-    }
-    for name, (func, help_text) in commands_to_register.items():
-        register_command(name, func, help_text)
-    logger.info(f"Accounting commands registered: {list(commands_to_register.keys())}")
@@ -9,8 +9,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-# Import register_command from the central location
-from djin.cli.commands import register_command
 from djin.features.notes.db.schema import get_connection, init_database
 
 # Set up logging
@@ -209,21 +207,3 @@ def note_command(args: List[str]) -> bool:
         console.print(f"[red]Unknown note subcommand: {subcommand}[/red]")
         console.print("Available subcommands: add, list, view, delete")
         return False
-
-
-# --- Registration Function ---
-
-
-def register_note_commands():
-    """Registers all commands related to the notes feature."""
-    commands_to_register = {
-        "note": (note_command, "Manage notes (add, list, view, delete)"),
-        "note add": (add_note_command, "Add a new note"),
-        "note list": (list_notes_command, "List all notes"),
-        "note view": (view_note_command, "View a specific note by ID"),
-        "note delete": (delete_note_command, "Delete a note by ID"),
-        "note debug": (debug_notes_db_command, "Debug the notes database"),
-    }
-    for name, (func, help_text) in commands_to_register.items():
-        register_command(name, func, help_text)
-    logger.info(f"Notes commands registered: {list(commands_to_register.keys())}")
@@ -5,15 +5,14 @@ SQLite database schema for Djin.
 import pathlib
 import sqlite3
 
-from rich.console import Console
-
-# Create console for rich output
-console = Console()
-
 # Database file path
 DB_DIR = pathlib.Path("~/.Djin").expanduser()
 DB_FILE = DB_DIR / "Djin.db"
 
+# Set once the schema has been created in this process, so later init_database() calls
+# (every notes command makes one) skip the connect and CREATE TABLE round trip
+_initialized = False
+
 # Table schemas
 SCHEMA = [
     """
@@ -65,6 +64,10 @@ def get_connection():
 
 def init_database():
     """Initialize the database with the schema."""
+    global _initialized
+    if _initialized:
+        return True
+
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -74,6 +77,7 @@ def init_database():
     conn.commit()
     conn.close()
 
+    _initialized = True
     return True
 
 
@@ -4,28 +4,17 @@ ABOUTME: Coordinates task fetching, summarization, and hour registration across
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from djin.common.errors import DjinError
+from djin.features.orchestrator.customers import CUSTOMERS
 from djin.features.tasks.api import get_tasks_api
 from djin.features.textsynth.api import TextSynthAPI
 
 logger = logging.getLogger("djin.orchestrator")
 
-CUSTOMERS = {
-    "AION": {
-        "task_source": "jira",
-        "moneymonk_project": "AION Titan",
-    },
-    "LG": {
-        "task_source": "ado",
-        "moneymonk_project": "LLM Project",
-        "ado_org": "hoogendoorn-growthmanagement",
-        "ado_project": "DataAnalytics",
-    },
-}
-
 
 class OrchestratorAgent:
     def __init__(self):
@@ -46,10 +35,15 @@ class OrchestratorAgent:
             DjinError: If the overview cannot be generated or task fetching fails.
         """
         try:
-            # Get task data using the updated API (returns Dict with 'tasks' and 'errors')
-            active_tasks_data = self._task_api.get_active_tasks()
-            todo_tasks_data = self._task_api.get_todo_tasks()
-            completed_tasks_data = self._task_api.get_completed_tasks(days=7)
+            # Get task data using the updated API (returns Dict with 'tasks' and 'errors').
+            # The three Jira queries are independent, so issue them concurrently.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                active_future = executor.submit(self._task_api.get_active_tasks)
+                todo_future = executor.submit(self._task_api.get_todo_tasks)
+                completed_future = executor.submit(self._task_api.get_completed_tasks, days=7)
+                active_tasks_data = active_future.result()
+                todo_tasks_data = todo_future.result()
+                completed_tasks_data = completed_future.result()
 
             # Check for errors from API calls
             errors = (
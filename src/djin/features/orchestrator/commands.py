@@ -3,6 +3,7 @@ ABOUTME: Command handlers for orchestrator operations.
 ABOUTME: Registers CLI commands for task overview, work summary, and time registration.
 """
 
+import functools
 import logging
 from datetime import datetime
 from typing import List
@@ -11,21 +12,26 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from djin.cli.commands import register_command
 from djin.common.errors import DjinError, handle_error
-from djin.features.orchestrator.agent import CUSTOMERS, OrchestratorAgent
+from djin.features.orchestrator.agent import OrchestratorAgent
+from djin.features.orchestrator.customers import CUSTOMERS
 
-# Create console and agent
+# Create console; the agent is created on first use
 console = Console()
-orchestrator_agent = OrchestratorAgent()
 logger = logging.getLogger("djin.orchestrator.commands")  # Define logger at module level
 
 
+@functools.lru_cache(maxsize=1)
+def _get_orchestrator_agent() -> OrchestratorAgent:
+    """Create the orchestrator agent on first use instead of at import."""
+    return OrchestratorAgent()
+
+
 def overview_command(args: List[str]) -> bool:
     """Show an overview of tasks."""
     try:
         console.print("[cyan]Fetching task overview...[/cyan]")
-        overview = orchestrator_agent.get_task_overview()
+        overview = _get_orchestrator_agent().get_task_overview()
 
         table = Table(title="Task Overview")
         table.add_column("Metric", style="cyan")
@@ -99,7 +105,7 @@ def work_summary_command(args: List[str]) -> bool:
             return False
 
         console.print(f"[cyan]Generating work summary for {customer} on {display_date}...[/cyan]")
-        summary_or_message = orchestrator_agent.generate_work_summary(date_str, customer=customer)
+        summary_or_message = _get_orchestrator_agent().generate_work_summary(date_str, customer=customer)
 
         if "No tasks found" in summary_or_message:
             console.print(f"[yellow]{summary_or_message}[/yellow]")
@@ -173,7 +179,7 @@ def register_time_command(args: List[str]) -> bool:
             f"with auto-generated summary...[/cyan]"
         )
 
-        result = orchestrator_agent.register_time_with_summary(date_str, hours, customer=customer)
+        result = _get_orchestrator_agent().register_time_with_summary(date_str, hours, customer=customer)
 
         if result["success"]:
             console.print(
@@ -210,24 +216,3 @@ def register_time_command(args: List[str]) -> bool:
         logger.error(f"Unexpected error in register-time command: {e}", exc_info=True)
         console.print("[bold red]An unexpected error occurred while registering time.[/bold red]")
         return False
-
-
-def register_orchestrator_commands():
-    """Registers all commands related to the orchestrator feature."""
-    # logger is defined at module level
-
-    valid_customers = "|".join(CUSTOMERS.keys())
-    commands_to_register = {
-        "overview": (overview_command, "Show an overview of your tasks"),
-        "work-summary": (
-            work_summary_command,
-            f"Generate a work summary (Usage: /work-summary [YYYY-MM-DD] <{valid_customers}>)",
-        ),
-        "register-time": (
-            register_time_command,
-            f"Register time with auto-generated summary (Usage: /register-time [YYYY-MM-DD] <{valid_customers}> [hours])",
-        ),
-    }
-    for name, (func, help_text) in commands_to_register.items():
-        register_command(name, func, help_text)
-    logger.info(f"Orchestrator commands registered: {list(commands_to_register.keys())}")
@@ -0,0 +1,17 @@
+"""
+ABOUTME: Customer definitions for the orchestrator.
+ABOUTME: Kept free of heavy imports so command registration can read them at startup.
+"""
+
+CUSTOMERS = {
+    "AION": {
+        "task_source": "jira",
+        "moneymonk_project": "AION Titan",
+    },
+    "LG": {
+        "task_source": "ado",
+        "moneymonk_project": "LLM Project",
+        "ado_org": "hoogendoorn-growthmanagement",
+        "ado_project": "DataAnalytics",
+    },
+}
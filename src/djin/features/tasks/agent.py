@@ -5,23 +5,24 @@ Task agent for Djin.
 This module provides an agent specialized in task operations.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 from loguru import logger
 
-from djin.features.tasks.graph.workflow import create_task_fetching_graph
+from djin.features.tasks.graph.workflow import get_task_fetching_graph
 
 
 class TaskAgent:
     def __init__(self):
-        self.task_fetching_workflow = create_task_fetching_graph()
+        # The compiled graph is stateless, so all agents share one instance
+        self.task_fetching_workflow = get_task_fetching_graph()
 
     def _invoke_workflow(self, initial_state: Dict) -> Dict[str, Any]:
         """Helper to invoke workflow and handle potential errors."""
         try:
             final_state = self.task_fetching_workflow.invoke(initial_state)
             return {
-                "processed_tasks": final_state.get("processed_tasks", []),
+                "processed_tasks": list(final_state.get("processed_tasks", ())),
                 "formatted_output": final_state.get("formatted_output", ""),
                 "errors": final_state.get("errors", []),
             }
@@ -33,10 +34,6 @@ class TaskAgent:
         """Process a request to show todo tasks. Returns processed tasks and errors."""
         initial_state = {
             "request_type": "todo",
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         return {"tasks": result["processed_tasks"], "errors": result["errors"]}
@@ -45,10 +42,6 @@ class TaskAgent:
         """Process a request to show active tasks. Returns processed tasks and errors."""
         initial_state = {
             "request_type": "active",
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         return {"tasks": result["processed_tasks"], "errors": result["errors"]}
@@ -58,10 +51,6 @@ class TaskAgent:
         initial_state = {
             "request_type": "worked_on",
             "date": date_str,
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         return {"tasks": result["processed_tasks"], "errors": result["errors"]}
@@ -71,10 +60,6 @@ class TaskAgent:
         initial_state = {
             "request_type": "completed",
             "days": days,
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         return {"tasks": result["processed_tasks"], "errors": result["errors"]}
@@ -85,25 +70,18 @@ class TaskAgent:
             "request_type": "set_status",
             "issue_key": issue_key,
             "status_name": status_name,
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         if result["errors"] and not result["formatted_output"]:
             return f"[red]Error setting status: {'; '.join(result['errors'])}[/red]"
         return result["formatted_output"]
 
-    def process_task_details_request(self, issue_key: str) -> str:
-        """Process a request for task details. Returns formatted details string."""
+    def process_task_details_request(self, issue_key: str, stream_to: Optional[TextIO] = None) -> str:
+        """Process a request for task details. Returns formatted details string, or "" when streamed."""
         initial_state = {
             "request_type": "task_details",
             "issue_key": issue_key,
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
+            "stream_to": stream_to,
         }
         result = self._invoke_workflow(initial_state)
         if result["errors"] and not result["formatted_output"]:
@@ -118,10 +96,6 @@ class TaskAgent:
             "summary": summary,
             "description": description,
             "issue_type": "Task",
-            "raw_tasks": [],
-            "processed_tasks": [],
-            "formatted_output": "",
-            "errors": [],
         }
         result = self._invoke_workflow(initial_state)
         if result["errors"] and not result["formatted_output"]:
@@ -4,7 +4,7 @@ Public API for the task agent.
 This module provides a public interface for other agents to call the task agent.
 """
 
-from typing import Any, Dict, Optional  # Added imports
+from typing import Any, Dict, Optional, TextIO  # Added imports
 
 from djin.features.tasks.agent import TaskAgent
 
@@ -70,17 +70,19 @@ class TaskAPI:
         return self._agent.process_completed_request(days)
 
     # --- Methods returning formatted strings directly ---
-    def get_task_details(self, issue_key: str) -> str:
+    def get_task_details(self, issue_key: str, stream_to: Optional[TextIO] = None) -> str:
         """
         Get details for a specific task.
 
         Args:
             issue_key: The Jira issue key (e.g., PROJ-123)
+            stream_to: Optional stream to render the details table to directly
 
         Returns:
-            str: Formatted output of task details or error message.
+            str: Formatted output of task details or error message; empty when the
+                details were rendered to stream_to.
         """
-        return self._agent.process_task_details_request(issue_key)
+        return self._agent.process_task_details_request(issue_key, stream_to=stream_to)
 
     def set_task_status(self, issue_key: str, status_name: str) -> str:
         """
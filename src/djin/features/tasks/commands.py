@@ -2,20 +2,29 @@
 Command handlers for Jira task management.
 """
 
+import sys
 from datetime import datetime
 from typing import List
 
 from loguru import logger
 from rich.console import Console
 
-from djin.cli.commands import register_command
 from djin.common.errors import DjinError, handle_error
+from djin.features.tasks.api import get_tasks_api
 from djin.features.tasks.display import format_tasks_table
 from djin.features.tasks.jira_client import JiraError
 
 console = Console()
 
 
+def _print_buffered(renderable) -> None:
+    """Render a Rich object off-screen and emit it with a single write and flush."""
+    with console.capture() as capture:
+        console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
+
 def _handle_task_list_result(result_dict: dict, title: str) -> bool:
     """Helper to display task list results or errors."""
     tasks = result_dict.get("tasks", [])
@@ -32,7 +41,7 @@ def _handle_task_list_result(result_dict: dict, title: str) -> bool:
 
     if tasks:
         table = format_tasks_table(tasks, title=title)
-        console.print(table)
+        _print_buffered(table)
         return True
     elif not errors:
         console.print(f"[yellow]No tasks found for '{title}'.[/yellow]")
@@ -47,8 +56,6 @@ def _handle_task_list_result(result_dict: dict, title: str) -> bool:
 def todo_command(args: List[str]) -> bool:
     """Show Jira issues in To Do status."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
         result_dict = tasks_api.get_todo_tasks()
         return _handle_task_list_result(result_dict, "My To Do Tasks")
@@ -64,8 +71,6 @@ def todo_command(args: List[str]) -> bool:
 def active_command(args: List[str]) -> bool:
     """Show all active Jira issues."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
         result_dict = tasks_api.get_active_tasks()
         return _handle_task_list_result(result_dict, "My Active Tasks")
@@ -81,13 +86,11 @@ def active_command(args: List[str]) -> bool:
 def worked_on_command(args: List[str]) -> bool:
     """Show Jira issues worked on for a specific date."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
 
         date_str = None
         display_date = "today"
-        if args and len(args) > 0:
+        if args:
             date_str = args[0]
             try:
                 datetime.strptime(date_str, "%Y-%m-%d")
@@ -114,12 +117,10 @@ def worked_on_command(args: List[str]) -> bool:
 def completed_command(args: List[str]) -> bool:
     """Show completed Jira issues."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
 
         days = 7
-        if args and len(args) > 0:
+        if args:
             try:
                 days = int(args[0])
             except ValueError:
@@ -139,16 +140,17 @@ def completed_command(args: List[str]) -> bool:
 def task_details_command(args: List[str]) -> bool:
     """Show details for a specific Jira issue."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
 
-        if not args or len(args) == 0:
+        if not args:
             console.print("[red]Error: Please provide a Jira issue key (e.g., /tasks PROJ-123)[/red]")
             return False
 
         issue_key = args[0]
-        result_output = tasks_api.get_task_details(issue_key)
+        # The details table is rendered straight to the terminal; only errors come back
+        result_output = tasks_api.get_task_details(issue_key, stream_to=sys.stdout)
+        if result_output:
+            console.print(result_output)
 
         return not result_output.strip().startswith("[red]")
 
@@ -165,8 +167,6 @@ def task_details_command(args: List[str]) -> bool:
 def set_task_status_command(args: List[str]) -> bool:
     """Transition a Jira issue to a new status."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
 
         if len(args) < 2:
@@ -195,11 +195,9 @@ def set_task_status_command(args: List[str]) -> bool:
 def create_ticket_command(args: List[str]) -> bool:
     """Create a new Jira ticket in the AION MEDIA GROUP project."""
     try:
-        from djin.features.tasks.api import get_tasks_api
-
         tasks_api = get_tasks_api()
 
-        if not args or len(args) < 2:
+        if len(args) < 2:
             console.print(
                 "[red]Error: Please provide a summary and description for the ticket.[/red]"
             )
@@ -207,7 +205,7 @@ def create_ticket_command(args: List[str]) -> bool:
             return False
 
         summary = args[0]
-        description = " ".join(args[1:]) if len(args) > 1 else ""
+        description = " ".join(args[1:])
 
         console.print("[cyan]Creating new ticket in AION MEDIA GROUP project...[/cyan]")
         result_output = tasks_api.create_ticket(summary, description)
@@ -222,34 +220,3 @@ def create_ticket_command(args: List[str]) -> bool:
         logger.error(f"Unexpected error in create-ticket command: {e}", exc_info=True)
         console.print("[bold red]An unexpected error occurred.[/bold red]")
         return False
-
-
-def register_task_commands():
-    """Registers all commands related to the tasks feature."""
-    commands_to_register = {
-        "tasks todo": (todo_command, "Show your Jira issues in To Do status"),
-        "tasks active": (active_command, "Show all your active Jira issues"),
-        "tasks worked-on": (
-            worked_on_command,
-            "Show Jira issues you worked on for a specific date (YYYY-MM-DD, default: today)",
-        ),
-        "tasks completed": (
-            completed_command,
-            "Show your completed Jira issues (default: last 7 days)",
-        ),
-        "tasks": (
-            task_details_command,
-            "Show details for a specific Jira issue (e.g., /tasks PROJ-123)",
-        ),
-        "tasks set-status": (
-            set_task_status_command,
-            "Set the status of a Jira issue (e.g., /tasks set-status PROJ-123 'In Progress')",
-        ),
-        "tasks create": (
-            create_ticket_command,
-            "Create a new Jira ticket in AION MEDIA GROUP (e.g., /tasks create \"Summary\" \"Description\")",
-        ),
-    }
-    for name, (func, help_text) in commands_to_register.items():
-        register_command(name, func, help_text)
-    logger.info(f"Task commands registered: {list(commands_to_register.keys())}")
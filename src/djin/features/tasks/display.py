@@ -4,40 +4,22 @@ Display utilities for tasks.
 This module provides functions for formatting and displaying tasks.
 """
 
-from rich.table import Table
-from rich.text import Text
+from datetime import datetime
 
-from djin.common.config import load_config
-from djin.features.tasks.jira_client import format_time_spent
+from rich.table import Column, Table
 
+from djin.features.tasks.jira_client import create_jira_link, format_time_spent
 
-def create_jira_link(issue_key: str) -> Text:
-    """
-    Create a clickable hyperlink for a JIRA issue key.
-
-    Args:
-        issue_key: The JIRA issue key (e.g., PROJ-1234)
-
-    Returns:
-        Text: A Rich Text object with a hyperlink that's clickable in compatible terminals
-    """
-    # Get Jira URL from config
-    config = load_config()
-    jira_url = config.get("jira", {}).get("url", "")
 
-    # Create browse URL
-    if jira_url:
-        if not jira_url.endswith("/"):
-            jira_url += "/"
-        browse_url = f"{jira_url}browse/{issue_key}"
-    else:
-        # Fallback to a generic format if URL not configured
-        browse_url = f"https://jira.atlassian.net/browse/{issue_key}"
-
-    # Create a Rich Text object with a hyperlink
-    text = Text(issue_key)
-    text.stylize(f"link {browse_url}")
-    return text
+# Column spec for task listings, built once; each table gets fresh copies with empty cells.
+# The summary width is capped so long titles are truncated instead of measured and wrapped.
+_TASK_COLUMNS = (
+    Column("Key", style="cyan", no_wrap=True),
+    Column("Summary", overflow="ellipsis", max_width=80, no_wrap=True),
+    Column("Status", style="green", no_wrap=True),
+    Column("Priority", no_wrap=True),
+    Column("Time Spent", style="yellow", no_wrap=True),
+)
 
 
 def format_tasks_table(tasks, title="Tasks"):
@@ -57,15 +39,14 @@ def format_tasks_table(tasks, title="Tasks"):
         table.add_row("No tasks found")
         return table
 
-    # Create table
-    table = Table(title=f"{title} ({len(tasks)} total)")
-
-    # Add columns
-    table.add_column("Key", style="cyan", no_wrap=True)
-    table.add_column("Summary")
-    table.add_column("Status", style="green", no_wrap=True)
-    table.add_column("Priority", no_wrap=True)
-    table.add_column("Time Spent", style="yellow", no_wrap=True)
+    # Create table from the prebuilt column spec
+    table = Table(
+        *(column.copy() for column in _TASK_COLUMNS),
+        title=f"{title} ({len(tasks)} total)",
+        show_lines=False,
+        padding=(0, 1),
+        collapse_padding=True,
+    )
 
     # Add rows
     for task in tasks:
@@ -84,6 +65,16 @@ def format_tasks_table(tasks, title="Tasks"):
     return table
 
 
+def _format_detail_date(value) -> str:
+    """Format an ISO date string from Jira as 'YYYY-MM-DD HH:MM', falling back to the raw value."""
+    if not isinstance(value, str):
+        return str(value)
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return value
+
+
 def format_task_details(task_details):
     """
     Format detailed information about a task.
@@ -94,60 +85,42 @@ def format_task_details(task_details):
     Returns:
         Table: A Rich Table object with detailed task information
     """
-    from datetime import datetime
-
     from rich.markdown import Markdown
     from rich.panel import Panel
-    from rich.table import Table
     from rich.text import Text
 
     # Create a panel for the task
     title = f"{task_details['key']}: {task_details['summary']}"
 
-    # Create a table for the details
-    details_table = Table(show_header=False, box=None)
-    details_table.add_column("Field", style="bold cyan")
-    details_table.add_column("Value")
-
-    # Add basic details
-    details_table.add_row("Status", task_details["status"])
-    details_table.add_row("Type", task_details["type"])
-    details_table.add_row("Priority", task_details.get("priority", "Unknown"))
-    details_table.add_row("Assignee", task_details.get("assignee", "Unassigned"))
-    details_table.add_row("Reporter", task_details.get("reporter", "Unknown"))
+    # Collect all rows first, then add them in one pass
+    rows = [
+        ("Status", task_details["status"]),
+        ("Type", task_details["type"]),
+        ("Priority", task_details.get("priority", "Unknown")),
+        ("Assignee", task_details.get("assignee", "Unassigned")),
+        ("Reporter", task_details.get("reporter", "Unknown")),
+    ]
 
     # Format dates
-    if "created" in task_details:
-        created_date = task_details["created"]
-        if isinstance(created_date, str):
-            # Parse ISO format date
-            try:
-                created_date = datetime.fromisoformat(created_date.replace("Z", "+00:00"))
-                details_table.add_row("Created", created_date.strftime("%Y-%m-%d %H:%M"))
-            except ValueError:
-                details_table.add_row("Created", created_date)
-        else:
-            details_table.add_row("Created", str(created_date))
-
-    if "updated" in task_details:
-        updated_date = task_details["updated"]
-        if isinstance(updated_date, str):
-            try:
-                updated_date = datetime.fromisoformat(updated_date.replace("Z", "+00:00"))
-                details_table.add_row("Updated", updated_date.strftime("%Y-%m-%d %H:%M"))
-            except ValueError:
-                details_table.add_row("Updated", updated_date)
-        else:
-            details_table.add_row("Updated", str(updated_date))
+    for field, label in (("created", "Created"), ("updated", "Updated")):
+        if field in task_details:
+            rows.append((label, _format_detail_date(task_details[field])))
 
     if "due_date" in task_details:
-        details_table.add_row("Due Date", task_details["due_date"])
+        rows.append(("Due Date", task_details["due_date"]))
 
     # Add time tracking info
     if "worklog_formatted" in task_details:
-        details_table.add_row("Time Spent", task_details["worklog_formatted"])
+        rows.append(("Time Spent", task_details["worklog_formatted"]))
     elif "worklog_seconds" in task_details:
-        details_table.add_row("Time Spent", format_time_spent(task_details["worklog_seconds"]))
+        rows.append(("Time Spent", format_time_spent(task_details["worklog_seconds"])))
+
+    # Fixed-width field column so Rich can skip measuring it
+    details_table = Table(show_header=False, box=None)
+    details_table.add_column("Field", style="bold cyan", width=12)
+    details_table.add_column("Value", overflow="fold")
+    for field, value in rows:
+        details_table.add_row(field, value)
 
     # Create a panel for the description if it exists
     description_panel = None
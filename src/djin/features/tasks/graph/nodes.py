@@ -4,108 +4,167 @@ Node definitions for task workflows.
 This module provides node functions for LangGraph workflows.
 """
 
-from djin.features.tasks.jira_client import get_my_completed_issues, get_my_issues
+import io
+
+from rich.console import Console
+from rich.markup import escape
+
+from djin.features.tasks.display import format_task_details
+from djin.features.tasks.jira_client import get_issue_url
+from djin.features.tasks.jira_client_cache import (
+    create_issue,
+    get_issue_details,
+    get_my_completed_issues,
+    get_my_issues,
+    get_worked_on_issues,
+    transition_issue,
+)
+
+
+class _MissingInputError(ValueError):
+    """Raised by a fetch handler when the request is missing a required field."""
+
+
+# JQL status filter per listing request type
+_STATUS_JQL = {
+    "todo": "status = 'To Do'",
+    "in_progress": "status = 'In Progress'",
+    # Active tasks include In Progress and Waiting for customer
+    "active": "status = 'In Progress'",  # OR status = 'Waiting for customer'"
+}
+
+
+def _fetch_by_status(state):
+    return get_my_issues(status_filter=_STATUS_JQL[state["request_type"]])
+
+
+def _fetch_worked_on(state):
+    # Get tasks worked on for a specific date
+    return get_worked_on_issues(state.get("date"))
+
+
+def _fetch_completed(state):
+    return get_my_completed_issues(days=state.get("days", 7))
+
+
+def _fetch_details(state):
+    # For task details, we'll put the result in raw_tasks even though it's a single item
+    issue_key = state.get("issue_key", "")
+    if not issue_key:
+        raise _MissingInputError("No issue key provided")
+    return [get_issue_details(issue_key)]  # Wrap in list to maintain consistent structure
+
+
+def _do_transition(state):
+    # For set_status, we need to transition the issue
+    issue_key = state.get("issue_key", "")
+    status_name = state.get("status_name", "")
+
+    if not issue_key:
+        raise _MissingInputError("No issue key provided")
+    if not status_name:
+        raise _MissingInputError("No status name provided")
+
+    # format_output_node only needs the key and the old/new status, and transition_issue
+    # already reads the current status, so no separate details fetch is needed
+    task_details = {"key": issue_key, "new_status": status_name}
+
+    try:
+        task_details["old_status"] = transition_issue(issue_key, status_name)
+        # Mark as successful in the task details
+        task_details["transition_success"] = True
+    except Exception as e:
+        # Mark as failed in the task details
+        task_details["transition_success"] = False
+        task_details["transition_error"] = str(e)
+
+    return [task_details]  # Wrap in list to maintain consistent structure
+
+
+def _do_create(state):
+    # For create_ticket, we need to create a new issue
+    project_key = state.get("project_key") or "AION"
+    summary = state.get("summary", "")
+    description = state.get("description", "")
+    issue_type = state.get("issue_type") or "Task"
+
+    if not summary:
+        raise _MissingInputError("No summary provided")
+
+    # Create the issue
+    try:
+        new_issue_key = create_issue(project_key, summary, description, issue_type)
+        # Get the details of the newly created issue
+        task_details = get_issue_details(new_issue_key)
+        # Mark as successful in the task details
+        task_details["creation_success"] = True
+        task_details["new_issue_key"] = new_issue_key
+    except Exception as e:
+        # Create a minimal task details dict with error info
+        task_details = {
+            "creation_success": False,
+            "creation_error": str(e),
+            "summary": summary,
+            "description": description,
+            "project_key": project_key,
+            "issue_type": issue_type,
+        }
+
+    return [task_details]  # Wrap in list to maintain consistent structure
+
+
+def _fetch_default(state):
+    return get_my_issues()
+
+
+# Fetch handler per request type; each takes the state and returns the raw tasks
+_HANDLERS = {
+    "todo": _fetch_by_status,
+    "in_progress": _fetch_by_status,
+    "active": _fetch_by_status,
+    "worked_on": _fetch_worked_on,
+    "completed": _fetch_completed,
+    "task_details": _fetch_details,
+    "set_status": _do_transition,
+    "create_ticket": _do_create,
+}
 
 
 # Node for fetching tasks
 def fetch_tasks_node(state):
     """Fetch tasks from Jira"""
+    handler = _HANDLERS.get(state.get("request_type"), _fetch_default)
     try:
-        # Fetch based on request type
-        if state.request_type == "todo":
-            status_filter = "status = 'To Do'"
-            raw_tasks = get_my_issues(status_filter=status_filter)
-        elif state.request_type == "in_progress":
-            status_filter = "status = 'In Progress'"
-            raw_tasks = get_my_issues(status_filter=status_filter)
-        elif state.request_type == "active":
-            # Active tasks include In Progress and Waiting for customer
-            status_filter = "status = 'In Progress'"  # OR status = 'Waiting for customer'"
-            raw_tasks = get_my_issues(status_filter=status_filter)
-        elif state.request_type == "worked_on":
-            # Get tasks worked on for a specific date
-            from djin.features.tasks.jira_client import get_worked_on_issues
-
-            date_str = getattr(state, "date", None)
-            raw_tasks = get_worked_on_issues(date_str)
-        elif state.request_type == "completed":
-            days = getattr(state, "days", 7)
-            raw_tasks = get_my_completed_issues(days=days)
-        elif state.request_type == "task_details":
-            # For task details, we'll put the result in raw_tasks even though it's a single item
-            from djin.features.tasks.jira_client import get_issue_details
-
-            issue_key = getattr(state, "issue_key", "")
-            if not issue_key:
-                return {"errors": state.errors + ["No issue key provided"]}
-            task_details = get_issue_details(issue_key)
-            raw_tasks = [task_details]  # Wrap in list to maintain consistent structure
-        elif state.request_type == "set_status":
-            # For set_status, we need to transition the issue
-            from djin.features.tasks.jira_client import get_issue_details, transition_issue
-
-            issue_key = getattr(state, "issue_key", "")
-            status_name = getattr(state, "status_name", "")
-
-            if not issue_key:
-                return {"errors": state.errors + ["No issue key provided"]}
-            if not status_name:
-                return {"errors": state.errors + ["No status name provided"]}
-
-            # First get the current details to show in the result
-            task_details = get_issue_details(issue_key)
-
-            # Then attempt the transition
-            try:
-                transition_issue(issue_key, status_name)
-                # Mark as successful in the task details
-                task_details["transition_success"] = True
-                task_details["old_status"] = task_details["status"]
-                task_details["new_status"] = status_name
-            except Exception as e:
-                # Mark as failed in the task details
-                task_details["transition_success"] = False
-                task_details["transition_error"] = str(e)
-
-            raw_tasks = [task_details]  # Wrap in list to maintain consistent structure
-        elif state.request_type == "create_ticket":
-            # For create_ticket, we need to create a new issue
-            from djin.features.tasks.jira_client import create_issue, get_issue_details
-
-            project_key = getattr(state, "project_key", "AION")
-            summary = getattr(state, "summary", "")
-            description = getattr(state, "description", "")
-            issue_type = getattr(state, "issue_type", "Task")
-
-            if not summary:
-                return {"errors": state.errors + ["No summary provided"]}
-
-            # Create the issue
-            try:
-                new_issue_key = create_issue(project_key, summary, description, issue_type)
-                # Get the details of the newly created issue
-                task_details = get_issue_details(new_issue_key)
-                # Mark as successful in the task details
-                task_details["creation_success"] = True
-                task_details["new_issue_key"] = new_issue_key
-            except Exception as e:
-                # Create a minimal task details dict with error info
-                task_details = {
-                    "creation_success": False,
-                    "creation_error": str(e),
-                    "summary": summary,
-                    "description": description,
-                    "project_key": project_key,
-                    "issue_type": issue_type,
-                }
-
-            raw_tasks = [task_details]  # Wrap in list to maintain consistent structure
-        else:
-            raw_tasks = get_my_issues()
-
-        return {"raw_tasks": raw_tasks}
+        return {"raw_tasks": handler(state)}
+    except _MissingInputError as e:
+        return {"errors": [str(e)]}
     except Exception as e:
-        return {"errors": state.errors + [f"Error fetching tasks: {str(e)}"]}
+        return {"errors": [f"Error fetching tasks: {str(e)}"]}
+
+
+def _task_row(issue):
+    """Flatten a raw Jira issue dict into a task dict."""
+    fields = issue["fields"]
+    return {
+        "key": issue["key"],
+        "summary": fields["summary"],
+        "status": fields["status"]["name"],
+        "type": fields["issuetype"]["name"],
+        "priority": (fields.get("priority") or {}).get("name", "Unknown"),
+        "assignee": (fields.get("assignee") or {}).get("displayName", "Unassigned"),
+        "worklog_seconds": issue.get("worklog_seconds", 0),
+    }
+
+
+# Request types whose fetch handler already returns a ready-to-use details dict
+DETAIL_REQUEST_TYPES = frozenset({"task_details", "set_status", "create_ticket"})
+
+
+def route_after_fetch(state):
+    """Skip the processing node for detail requests and for listings that came back empty."""
+    if state.get("request_type") in DETAIL_REQUEST_TYPES or not state.get("raw_tasks"):
+        return "format_output"
+    return "process_tasks"
 
 
 # Node for processing tasks
@@ -113,112 +172,90 @@ def process_tasks_node(state):
     """Process the raw tasks using LLM if needed"""
     # For simple todo listing, we might not need LLM processing
     # But this node allows for more complex processing in the future
-    processed_tasks = []
-
-    # Handle task_details, set_status, and create_ticket differently since they're already dictionaries
-    if (state.request_type in ["task_details", "set_status", "create_ticket"]) and state.raw_tasks:
-        # The task details are already processed by get_issue_details or create_issue
-        processed_tasks = state.raw_tasks
-    else:
-        # Process regular Jira issue objects
-        for issue in state.raw_tasks:
-            processed_tasks.append({
-                "key": issue.key,
-                "summary": issue.fields.summary,
-                "status": issue.fields.status.name,
-                "type": issue.fields.issuetype.name,
-                "priority": getattr(issue.fields.priority, "name", "Unknown"),
-                "assignee": getattr(issue.fields.assignee, "displayName", "Unassigned")
-                if hasattr(issue.fields, "assignee")
-                else "Unassigned",
-                "worklog_seconds": getattr(issue, "worklog_seconds", 0),
-            })
+    # Process raw Jira issue dicts; single-issue requests and empty listings bypass this node
+    processed_tasks = [_task_row(issue) for issue in state.get("raw_tasks", ())]
     return {"processed_tasks": processed_tasks}
 
 
 # Node for formatting output (now primarily prepares data, not visual output)
 def format_output_node(state):
     """Finalize the state, potentially adding messages or handling errors."""
-    # For task_details and set_status, we still need formatted output for direct display
-    if state.request_type == "task_details":
-        from rich.console import Console
-
-        from djin.features.tasks.display import format_task_details
+    request_type = state.get("request_type", "")
+    issue_key = state.get("issue_key", "")
+    raw_tasks = state.get("raw_tasks", ())
+    errors = state.get("errors", [])
 
-        console = Console(record=True)
-        if state.processed_tasks:
-            task_details_table = format_task_details(state.processed_tasks[0])
-            console.print(task_details_table)
+    # task_details renders a real table; stream it when the caller gives us a stream,
+    # and only record it into a string when the caller needs the captured text
+    if request_type == "task_details":
+        if not raw_tasks:
+            formatted_output = f"[red]No details found for issue {issue_key}[/red]"
+        elif state.get("stream_to") is not None:
+            Console(file=state["stream_to"]).print(format_task_details(raw_tasks[0]))
+            formatted_output = ""
         else:
-            console.print(f"[red]No details found for issue {state.issue_key}[/red]")
-        return {
-            "formatted_output": console.export_text(),
-            "processed_tasks": state.processed_tasks,
-            "errors": state.errors,
-        }
+            console = Console(file=io.StringIO(), record=True)
+            console.print(format_task_details(raw_tasks[0]))
+            formatted_output = console.export_text()
+        return {"formatted_output": formatted_output, "processed_tasks": raw_tasks}
 
-    elif state.request_type == "set_status":
-        from rich.console import Console
-
-        console = Console(record=True)
-        if state.processed_tasks:
-            task = state.processed_tasks[0]
+    # set_status and create_ticket produce short status messages; compose the Rich markup
+    # directly and let the command layer print it once.
+    elif request_type == "set_status":
+        new_errors = []
+        if raw_tasks:
+            task = raw_tasks[0]
             if task.get("transition_success", False):
-                console.print(
-                    f"[green]Successfully transitioned {task['key']} from '{task['old_status']}' to '{task['new_status']}'[/green]"
+                formatted_output = (
+                    f"[green]Successfully transitioned {task['key']} "
+                    f"from '{task['old_status']}' to '{task['new_status']}'[/green]"
                 )
             else:
                 error_msg = task.get("transition_error", "Unknown error")
-                console.print(f"[red]Error transitioning {task['key']}: {error_msg}[/red]")
+                formatted_output = f"[red]Error transitioning {task['key']}: {escape(error_msg)}[/red]"
         else:
             # This case might indicate an error fetching the task before transitioning
-            console.print(f"[red]Could not retrieve details for issue {state.issue_key} to attempt transition.[/red]")
+            formatted_output = f"[red]Could not retrieve details for issue {issue_key} to attempt transition.[/red]"
             # Add error to state if not already present
-            if not any(f"Could not retrieve details for issue {state.issue_key}" in err for err in state.errors):
-                state.errors.append(f"Could not retrieve details for issue {state.issue_key} before transition.")
+            if not any(f"Could not retrieve details for issue {issue_key}" in err for err in errors):
+                new_errors.append(f"Could not retrieve details for issue {issue_key} before transition.")
 
-        return {
-            "formatted_output": console.export_text(),
-            "processed_tasks": state.processed_tasks,
-            "errors": state.errors,
-        }
-    
-    elif state.request_type == "create_ticket":
-        from rich.console import Console
-        from djin.features.tasks.display import create_jira_link
-
-        console = Console(record=True)
-        if state.processed_tasks:
-            task = state.processed_tasks[0]
+        return {"formatted_output": formatted_output, "processed_tasks": raw_tasks, "errors": new_errors}
+
+    elif request_type == "create_ticket":
+        new_errors = []
+        if raw_tasks:
+            task = raw_tasks[0]
             if task.get("creation_success", False):
-                issue_key = task.get("new_issue_key", "")
-                issue_link = create_jira_link(issue_key)
-                console.print(f"[green]Successfully created new ticket: {issue_key}[/green]")
-                console.print(f"Summary: {task.get('summary', '')}")
-                console.print(f"Link: {issue_link}")
+                new_issue_key = task.get("new_issue_key", "")
+                issue_url = get_issue_url(new_issue_key)
+                formatted_output = (
+                    f"[green]Successfully created new ticket: {new_issue_key}[/green]\n"
+                    f"Summary: {escape(task.get('summary', ''))}\n"
+                    f"Link: [link={issue_url}]{issue_url}[/link]"
+                )
             else:
                 error_msg = task.get("creation_error", "Unknown error")
-                console.print(f"[red]Error creating ticket: {error_msg}[/red]")
-                console.print(f"Summary: {task.get('summary', '')}")
+                formatted_output = (
+                    f"[red]Error creating ticket: {escape(error_msg)}[/red]\nSummary: {escape(task.get('summary', ''))}"
+                )
         else:
             # This case might indicate an error in the workflow
-            console.print("[red]Failed to create ticket due to an unknown error.[/red]")
+            formatted_output = "[red]Failed to create ticket due to an unknown error.[/red]"
             # Add error to state if not already present
-            if not any("Failed to create ticket" in err for err in state.errors):
-                state.errors.append("Failed to create ticket due to an unknown error.")
+            if not any("Failed to create ticket" in err for err in errors):
+                new_errors.append("Failed to create ticket due to an unknown error.")
 
-        return {
-            "formatted_output": console.export_text(),
-            "processed_tasks": state.processed_tasks,
-            "errors": state.errors,
-        }
+        return {"formatted_output": formatted_output, "processed_tasks": raw_tasks, "errors": new_errors}
 
-    # For list-based requests, just pass through the processed tasks and errors.
+    # For list-based requests, just pass through the processed tasks.
     # The command layer will handle formatting the table.
     # We can add specific messages here if needed.
-    elif state.request_type == "worked_on" and not state.processed_tasks:
-        if not state.errors:
-            date_display = state.date if state.date else "today"
+    new_errors = []
+    processed_tasks = state.get("processed_tasks", ())
+    if request_type == "worked_on" and not processed_tasks:
+        if not errors:
+            date_display = state.get("date") or "today"
             message = (
                 f"No tasks found that you worked on {date_display}.\n"
                 "This could be because:\n"
@@ -227,8 +264,8 @@ def format_output_node(state):
                 "  • You didn't update any assigned tasks on this date\n"
                 "  • You didn't resolve any tasks on this date"
             )
-            state.errors.append(message)
+            new_errors.append(message)
 
-    # Return the state, ensuring processed_tasks and errors are passed through.
+    # Return the processed tasks and any new errors.
     # formatted_output will be empty for list-based requests now.
-    return {"processed_tasks": state.processed_tasks, "errors": state.errors, "formatted_output": ""}
+    return {"processed_tasks": processed_tasks, "errors": new_errors, "formatted_output": ""}
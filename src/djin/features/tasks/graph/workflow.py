@@ -4,9 +4,16 @@ Workflow definitions for task operations.
 This module provides LangGraph workflow definitions for task operations.
 """
 
+import functools
+
 from langgraph.graph import StateGraph
 
-from djin.features.tasks.graph.nodes import fetch_tasks_node, format_output_node, process_tasks_node
+from djin.features.tasks.graph.nodes import (
+    fetch_tasks_node,
+    format_output_node,
+    process_tasks_node,
+    route_after_fetch,
+)
 from djin.features.tasks.graph.state import TaskState
 
 
@@ -22,8 +29,15 @@ def create_task_fetching_graph():
 
     # Define the flow
     workflow.set_entry_point("fetch_tasks")
-    workflow.add_edge("fetch_tasks", "process_tasks")
+    # Single-issue requests and empty listings go straight to formatting; other listings are processed first
+    workflow.add_conditional_edges("fetch_tasks", route_after_fetch)
     workflow.add_edge("process_tasks", "format_output")
 
     # Compile the graph
     return workflow.compile()
+
+
+@functools.cache
+def get_task_fetching_graph():
+    """Return the compiled task fetching graph, building it on first use"""
+    return create_task_fetching_graph()
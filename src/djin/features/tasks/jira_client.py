@@ -4,21 +4,95 @@ Jira client for Djin.
 This module provides functions for connecting to Jira and managing stories and tasks.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from jira import JIRA
 from loguru import logger
-from rich.console import Console
-from rich.table import Table
+from requests.adapters import HTTPAdapter
 from rich.text import Text
+from urllib3.util.retry import Retry
 
 from djin.common.config import load_config
 from djin.common.errors import JiraError
 
-console = Console()
+# Fields read from issue listings; requesting only these keeps search payloads small.
+# timespent is Jira's own total of all logged work, so no worklog request is needed per issue.
+_LIST_FIELDS = "summary,status,issuetype,priority,assignee,timespent"
+
+# Fields shown in the issue detail view
+_DETAIL_FIELDS = "summary,status,issuetype,priority,assignee,reporter,created,updated,description,duedate,timespent"
+
+# Page size requested per search call and concurrency used when a search spans several pages.
+# Servers may return smaller pages (Jira Cloud caps searches at 100); later pages follow
+# the page size the server actually used.
+_PAGE_SIZE = 500
+_MAX_PAGE_WORKERS = 5  # Default; override with "async_workers" in the jira config
+
+# Upper bound on issues collected by each worked-on probe; the library default of 50 silently truncated them
+_PROBE_MAX_RESULTS = 500
+
+# Worked-on probes return the listing fields directly, plus "updated" to order the merged result
+_WORKED_ON_FIELDS = _LIST_FIELDS + ",updated"
+
+# Independent probes for activity on a date: (description, JQL template formatted with the date).
+# Note that from Jira 9 the worklog index only keeps an issue's 100 most recent entries, so the
+# worklogDate probe can miss older-logged work on busy issues; the other probes usually still
+# pick those up.
+_WORKED_ON_PROBES = (
+    (
+        "issues with worklog entries",
+        "worklogDate = {date} AND worklogAuthor = currentUser() ORDER BY updated DESC",
+    ),
+    (
+        "issues updated on this date",
+        "assignee = currentUser() AND updated >= '{date} 00:00' AND updated <= '{date} 23:59' ORDER BY updated DESC",
+    ),
+    (
+        "issues with status changes",
+        "assignee = currentUser() AND status CHANGED DURING ('{date} 00:00', '{date} 23:59') ORDER BY updated DESC",
+    ),
+    (
+        "issues that were In Progress on this date",
+        "assignee = currentUser() AND (status WAS 'In Progress' ON '{date}' "
+        "OR status WAS 'Work in progress' ON '{date}') ORDER BY updated DESC",
+    ),
+    (
+        "issues assigned on this date",
+        "assignee = currentUser() AND assignee CHANGED DURING ('{date} 00:00', '{date} 23:59') ORDER BY updated DESC",
+    ),
+)
+# When the worklogDate probe (the first one) finds at least this many issues, its result is
+# taken as the answer and the heuristic fallback probes are skipped
+_MIN_CONFIDENT_WORKLOG_ISSUES = 1
+
+_COMMENTED_JQL = (
+    'issueFunction in commented(\'by currentUser() after "{date} 00:00" before "{date} 23:59"\') '
+    "ORDER BY updated DESC"
+)
+
+# Connection pool for the Jira session; sized for the nested fan-out of the worked-on
+# probes (six threads, each fetching pages with its own workers) and the overview threads
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+
+# Transitions depend on the workflow, which changes on deploys rather than per request
+_TRANSITION_MAP_TTL_SECONDS = 6 * 60 * 60
+
+# Retries for requests rejected by Jira's rate limiter (HTTP 429) or failing with a server
+# error; the jira library's ResilientSession backs off between them and honors Retry-After
+_RATE_LIMIT_RETRIES = 3
 
 jira_client: Optional[JIRA] = None
+_jira_client_lock = threading.Lock()
+_page_cap_warned = False
+
+_transition_maps: Dict[Tuple[str, str, str], Dict[str, Tuple[str, str]]] = {}
+_transition_maps_loaded_at = time.monotonic()
 
 
 def get_jira_client() -> JIRA:
@@ -36,66 +110,169 @@ def get_jira_client() -> JIRA:
     if jira_client is not None:
         return jira_client
 
-    # Load configuration
-    config = load_config()
-    jira_config = config.get("jira", {})
+    # Guard initialization so concurrent callers share a single client
+    with _jira_client_lock:
+        if jira_client is not None:
+            return jira_client
+
+        # Load configuration
+        config = load_config()
+        jira_config = config.get("jira", {})
+
+        # Check if Jira is configured
+        if not jira_config.get("url") or not jira_config.get("username") or not jira_config.get("api_token"):
+            raise JiraError("Jira is not configured. Run 'djin config' to set up Jira.")
+
+        try:
+            # Initialize Jira client
+            client = JIRA(
+                server=jira_config["url"],
+                basic_auth=(jira_config["username"], jira_config["api_token"]),
+                max_retries=_RATE_LIMIT_RETRIES,
+            )
+            _mount_pooled_adapter(client._session)
+            jira_client = client
+            return jira_client
+        except Exception as e:
+            raise JiraError(f"Failed to connect to Jira: {str(e)}")
+
+
+def _mount_pooled_adapter(session: Any) -> None:
+    """
+    Mount a pooled HTTP adapter on the Jira session so connections are kept alive and reused.
+
+    Connection-level failures are retried with backoff; HTTP status retries are left to the
+    Jira library's own resilient session.
+
+    Args:
+        session: The requests session used by the Jira client
+    """
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=()),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-    # Check if Jira is configured
-    if not jira_config.get("url") or not jira_config.get("username") or not jira_config.get("api_token"):
-        raise JiraError("Jira is not configured. Run 'djin config' to set up Jira.")
 
+@functools.lru_cache(maxsize=1)
+def _page_workers() -> int:
+    """Return how many search pages may be fetched concurrently, read once from the jira config."""
     try:
-        # Initialize Jira client
-        jira_client = JIRA(server=jira_config["url"], basic_auth=(jira_config["username"], jira_config["api_token"]))
-        return jira_client
-    except Exception as e:
-        raise JiraError(f"Failed to connect to Jira: {str(e)}")
+        return max(1, int(load_config().get("jira", {}).get("async_workers", _MAX_PAGE_WORKERS)))
+    except (TypeError, ValueError):
+        return _MAX_PAGE_WORKERS
 
 
-def get_my_issues(status_filter: str = None) -> List[Any]:
+def _iter_issues_paged(jira: JIRA, jql: str, fields: str, max_results: int) -> Iterator[Dict[str, Any]]:
     """
-    Get issues assigned to the current user with optional status filtering.
+    Run a JQL search and yield issues page by page, fetching any pages after the first one concurrently.
+
+    The first page doubles as a probe for the total result count; the remaining
+    pages are requested in parallel and yielded in order as soon as each one arrives.
+    Issues are the raw JSON dicts from the REST API, skipping the jira library's object wrapping.
+
+    Args:
+        jira: The Jira client
+        jql: The JQL query string
+        fields: Comma-separated list of fields to return
+        max_results: Maximum number of issues to return
+
+    Yields:
+        Dict[str, Any]: Raw JIRA issue dicts
+    """
+
+    def fetch_page(start_at: int, page_size: int) -> Dict[str, Any]:
+        return jira.search_issues(jql, startAt=start_at, maxResults=page_size, fields=fields, json_result=True)
+
+    global _page_cap_warned
+
+    requested_size = min(_PAGE_SIZE, max_results)
+    first_page = fetch_page(0, requested_size)
+    issues = first_page.get("issues", [])
+    yield from issues
+    total = min(first_page.get("total", len(issues)), max_results)
+    if total <= len(issues):
+        return
+
+    # Follow the page size the server actually used for the remaining pages
+    page_size = max(1, min(first_page.get("maxResults") or len(issues), requested_size))
+    if page_size < requested_size and not _page_cap_warned:
+        _page_cap_warned = True
+        logger.warning(f"Jira capped search pages at {page_size} results; fetching remaining pages in parallel")
+
+    offsets = range(len(issues), total, page_size)
+    page_sizes = [min(page_size, total - start_at) for start_at in offsets]
+
+    with ThreadPoolExecutor(max_workers=_page_workers()) as executor:
+        for page in executor.map(fetch_page, offsets, page_sizes):
+            yield from page.get("issues", [])
+
+
+def _search_issues_paged(jira: JIRA, jql: str, fields: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run a JQL search like _iter_issues_paged and return all issues as a list."""
+    return list(_iter_issues_paged(jira, jql, fields, max_results))
+
+
+def _my_issues_jql(status_filter: Optional[str]) -> str:
+    """Build the JQL for issues assigned to the current user, optionally filtered by status."""
+    if status_filter:
+        return f"assignee = currentUser() AND {status_filter} ORDER BY priority DESC, updated DESC"
+    return (
+        "assignee = currentUser() AND status != Done AND status != Resolved "
+        " ORDER BY priority DESC, updated DESC"
+    )
+
+
+def yield_my_issues(status_filter: str = None, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    Yield issues assigned to the current user as search pages arrive, instead of collecting them first.
 
     Args:
         status_filter: Optional status filter string for JQL (e.g., "status = 'In Progress'")
+        batch_size: Maximum number of issues to fetch (default: 500)
 
-    Returns:
-        List[Any]: List of JIRA issue objects
+    Yields:
+        Dict[str, Any]: Raw JIRA issue dicts, with worklog_seconds set
+
+    Raises:
+        JiraError: If the search fails
     """
     jira = get_jira_client()
 
     try:
-        if status_filter:
-            jql = f"assignee = currentUser() AND {status_filter} ORDER BY priority DESC, updated DESC"
-        else:
-            jql = (
-                "assignee = currentUser() AND status != Done AND status != Resolved "
-                " ORDER BY priority DESC, updated DESC"
-            )
+        for issue in _iter_issues_paged(jira, _my_issues_jql(status_filter), _LIST_FIELDS, batch_size):
+            issue["worklog_seconds"] = issue["fields"].get("timespent") or 0
+            yield issue
+    except Exception as e:
+        raise JiraError(f"Failed to get assigned issues: {str(e)}")
 
-        issues = jira.search_issues(jql)
 
-        for issue in issues:
-            try:
-                issue.worklog_seconds = get_issue_worklog_time(issue.key)
-            except Exception as e:
-                logger.error(f"Error fetching worklog for {issue.key}: {str(e)}")
-                issue.worklog_seconds = 0
+def get_my_issues(status_filter: str = None, batch_size: int = 500) -> List[Dict[str, Any]]:
+    """
+    Get issues assigned to the current user with optional status filtering.
 
-        return issues
-    except Exception as e:
-        raise JiraError(f"Failed to get assigned issues: {str(e)}")
+    Args:
+        status_filter: Optional status filter string for JQL (e.g., "status = 'In Progress'")
+        batch_size: Maximum number of issues to fetch (default: 500)
+
+    Returns:
+        List[Dict[str, Any]]: List of raw JIRA issue dicts
+    """
+    return list(yield_my_issues(status_filter, batch_size))
 
 
-def get_my_completed_issues(days: int = 7) -> List[Any]:
+def get_my_completed_issues(days: int = 7, batch_size: int = 500) -> List[Dict[str, Any]]:
     """
     Get issues assigned to the current user that were completed in the last specified days.
 
     Args:
         days: Number of days to look back (default: 7)
+        batch_size: Maximum number of issues to fetch (default: 500)
 
     Returns:
-        List[Any]: List of JIRA issue objects
+        List[Dict[str, Any]]: List of raw JIRA issue dicts
     """
     jira = get_jira_client()
 
@@ -105,63 +282,48 @@ def get_my_completed_issues(days: int = 7) -> List[Any]:
             "assignee = currentUser() AND (status = Done OR status = Resolved) "
             f"AND updated >= {one_week_ago} ORDER BY updated DESC"
         )
-        issues = jira.search_issues(jql)
+        issues = _search_issues_paged(jira, jql, _LIST_FIELDS, batch_size)
 
-        for issue in issues:
-            try:
-                issue.worklog_seconds = get_issue_worklog_time(issue.key)
-            except Exception as e:
-                logger.error(f"Error fetching worklog for {issue.key}: {str(e)}")
-                issue.worklog_seconds = 0
+        _attach_worklog_seconds(issues)
 
         return issues
     except Exception as e:
         raise JiraError(f"Failed to get completed issues: {str(e)}")
 
 
-def get_issue_worklog_time(issue_key: str) -> int:
+def _attach_worklog_seconds(issues: List[Dict[str, Any]]) -> None:
     """
-    Get the total time spent on an issue in seconds.
+    Set worklog_seconds on each issue from the aggregated timespent field in its search result.
 
     Args:
-        issue_key: The JIRA issue key
-
-    Returns:
-        int: Total time spent in seconds
+        issues: List of raw JIRA issue dicts fetched with the timespent field
     """
-    jira = get_jira_client()
-
-    try:
-        worklog = jira.worklogs(issue_key)
-        total_seconds = sum(entry.timeSpentSeconds for entry in worklog)
-        return total_seconds
-    except Exception as e:
-        logger.error(f"Error fetching worklog for {issue_key}: {str(e)}")
-        return 0
+    for issue in issues:
+        # timespent is null until work has been logged
+        issue["worklog_seconds"] = issue["fields"].get("timespent") or 0
 
 
+@functools.lru_cache(maxsize=4096)
 def format_time_spent(seconds: int) -> str:
     """
     Format time spent in a human-readable format.
 
+    Worklog totals repeat a lot across rows (0, whole hours), so results are memoized.
+
     Args:
         seconds: Time spent in seconds
 
     Returns:
         str: Formatted time string (e.g., "2h 30m")
     """
-    if seconds == 0:
+    if not seconds:
         return ""
 
-    hours, remainder = divmod(seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
+    hours, minutes = divmod(seconds // 60, 60)
 
-    if hours > 0 and minutes > 0:
+    if hours and minutes:
         return f"{hours}h {minutes}m"
-    elif hours > 0:
-        return f"{hours}h"
-    else:
-        return f"{minutes}m"
+    return f"{hours}h" if hours else f"{minutes}m"
 
 
 def get_issue_details(issue_key: str) -> Dict[str, Any]:
@@ -180,91 +342,81 @@ def get_issue_details(issue_key: str) -> Dict[str, Any]:
     jira = get_jira_client()
 
     try:
-        issue = jira.issue(issue_key)
+        issue = jira.issue(issue_key, fields=_DETAIL_FIELDS)
+        # Every requested field is present in the raw response (null when unset),
+        # so read it directly instead of probing the wrapped object with hasattr/getattr
+        fields = issue.raw["fields"]
+
+        # timespent is Jira's total of all logged work (null until work is logged)
+        worklog_seconds = fields.get("timespent") or 0
 
         details = {
             "key": issue.key,
-            "summary": issue.fields.summary,
-            "status": issue.fields.status.name,
-            "type": issue.fields.issuetype.name,
-            "priority": getattr(issue.fields.priority, "name", "Unknown"),
-            "assignee": getattr(issue.fields.assignee, "displayName", "Unassigned")
-            if hasattr(issue.fields, "assignee")
-            else "Unassigned",
-            "reporter": getattr(issue.fields.reporter, "displayName", "Unknown")
-            if hasattr(issue.fields, "reporter")
-            else "Unknown",
-            "created": issue.fields.created,
-            "updated": issue.fields.updated,
-            "description": issue.fields.description or "",
-            "worklog_seconds": get_issue_worklog_time(issue_key),
-            "worklog_formatted": format_time_spent(get_issue_worklog_time(issue_key)),
+            "summary": fields["summary"],
+            "status": fields["status"]["name"],
+            "type": fields["issuetype"]["name"],
+            "priority": (fields.get("priority") or {}).get("name", "Unknown"),
+            "assignee": (fields.get("assignee") or {}).get("displayName", "Unassigned"),
+            "reporter": (fields.get("reporter") or {}).get("displayName", "Unknown"),
+            "created": fields.get("created"),
+            "updated": fields.get("updated"),
+            "description": fields.get("description") or "",
+            "worklog_seconds": worklog_seconds,
+            "worklog_formatted": format_time_spent(worklog_seconds),
         }
 
-        if hasattr(issue.fields, "duedate") and issue.fields.duedate:
-            details["due_date"] = issue.fields.duedate
+        if fields.get("duedate"):
+            details["due_date"] = fields["duedate"]
 
         return details
     except Exception as e:
         raise JiraError(f"Failed to get issue details for {issue_key}: {str(e)}")
 
 
-def create_jira_link(issue_key: str) -> Text:
+@functools.lru_cache(maxsize=1)
+def _scriptrunner_enabled() -> bool:
+    """Return whether the configured Jira instance supports ScriptRunner's issueFunction JQL."""
+    enabled = bool(load_config().get("jira", {}).get("scriptrunner", False))
+    if not enabled:
+        # Cached, so this is logged once per process
+        logger.debug(
+            "ScriptRunner is not enabled in the jira config; worked-on searches skip the commented-issues probe. "
+            'Set "scriptrunner": true in the jira config or rerun djin --setup to enable it.'
+        )
+    return enabled
+
+
+@functools.lru_cache(maxsize=1)
+def _browse_prefix() -> str:
+    """Return the Jira browse URL prefix, reading the configured base URL only once."""
+    jira_url = load_config().get("jira", {}).get("url", "").rstrip("/")
+    return (jira_url or "https://jira.atlassian.net") + "/browse/"
+
+
+def get_issue_url(issue_key: str) -> str:
     """
-    Create a clickable hyperlink for a JIRA issue key.
+    Get the browse URL for a JIRA issue key.
 
     Args:
         issue_key: The JIRA issue key (e.g., PROJ-1234)
 
     Returns:
-        Text: A Rich Text object with a hyperlink that's clickable in compatible terminals
+        str: The URL of the issue in the configured Jira instance
     """
-    config = load_config()
-    jira_url = config.get("jira", {}).get("url", "")
-
-    if jira_url:
-        if not jira_url.endswith("/"):
-            jira_url += "/"
-        browse_url = f"{jira_url}browse/{issue_key}"
-    else:
-        browse_url = f"https://jira.atlassian.net/browse/{issue_key}"
-    text = Text(issue_key)
-    text.stylize(f"link {browse_url}")
-    return text
+    return _browse_prefix() + issue_key
 
 
-def display_issues(issues: List[Any], title: str = "My Issues") -> None:
+def create_jira_link(issue_key: str) -> Text:
     """
-    Display a list of issues in a rich table.
+    Create a clickable hyperlink for a JIRA issue key.
 
     Args:
-        issues: List of JIRA issue objects
-        title: Title for the table
-    """
-    if not issues:
-        console.print(f"[yellow]No issues found for: {title}[/yellow]")
-        return
-
-    table = Table(title=f"{title} ({len(issues)} total)")
-
-    table.add_column("Key", style="cyan", no_wrap=True)
-    table.add_column("Summary")
-    table.add_column("Status", style="green", no_wrap=True)
-    table.add_column("Priority", no_wrap=True)
-    table.add_column("Time Spent", style="yellow", no_wrap=True)
-
-    for issue in issues:
-        time_spent = format_time_spent(getattr(issue, "worklog_seconds", 0))
-
-        table.add_row(
-            create_jira_link(issue.key),
-            issue.fields.summary,
-            issue.fields.status.name,
-            getattr(issue.fields.priority, "name", "Unknown"),
-            time_spent,
-        )
+        issue_key: The JIRA issue key (e.g., PROJ-1234)
 
-    console.print(table)
+    Returns:
+        Text: A Rich Text object with a hyperlink that's clickable in compatible terminals
+    """
+    return Text(issue_key, style="link " + get_issue_url(issue_key))
 
 
 def add_comment(issue_key: str, comment_text: str) -> bool:
@@ -284,14 +436,54 @@ def add_comment(issue_key: str, comment_text: str) -> bool:
     jira = get_jira_client()
 
     try:
-        issue = jira.issue(issue_key)
-        jira.add_comment(issue, comment_text)
+        jira.add_comment(issue_key, comment_text)
         return True
     except Exception as e:
         raise JiraError(f"Failed to add comment to {issue_key}: {str(e)}")
 
 
-def transition_issue(issue_key: str, transition_name: str) -> bool:
+def transition_map_cache_clear() -> None:
+    """Forget all cached transition maps, e.g. after a Jira workflow change."""
+    global _transition_maps_loaded_at
+
+    _transition_maps.clear()
+    _transition_maps_loaded_at = time.monotonic()
+
+
+def _get_transition_map(jira: JIRA, issue: Any, refresh: bool = False) -> Dict[str, Tuple[str, str]]:
+    """
+    Get the available transitions for an issue, keyed by lowercased name.
+
+    Transitions only depend on the workflow position of an issue, so maps are cached per
+    (project, issue type, status) and reused until they expire or are cleared.
+
+    Args:
+        jira: The Jira client
+        issue: The issue, fetched with at least the project, issuetype and status fields
+        refresh: Bypass the cache and fetch the transitions again
+
+    Returns:
+        Dict[str, Tuple[str, str]]: Mapping of lowercased transition name to (name, transition ID)
+    """
+    if time.monotonic() - _transition_maps_loaded_at > _TRANSITION_MAP_TTL_SECONDS:
+        transition_map_cache_clear()
+
+    fields = issue.fields
+    cache_key = (fields.project.key, fields.issuetype.name, fields.status.name)
+    transition_map = None if refresh else _transition_maps.get(cache_key)
+    if transition_map is None:
+        transition_map = {t["name"].lower(): (t["name"], t["id"]) for t in jira.transitions(issue)}
+        _transition_maps[cache_key] = transition_map
+    return transition_map
+
+
+def _find_transition_id(transition_map: Dict[str, Tuple[str, str]], transition_name: str) -> Optional[str]:
+    """Look up a transition ID by name, ignoring case."""
+    entry = transition_map.get(transition_name.lower())
+    return entry[1] if entry else None
+
+
+def transition_issue(issue_key: str, transition_name: str) -> str:
     """
     Transition an issue to a new status.
 
@@ -300,7 +492,7 @@ def transition_issue(issue_key: str, transition_name: str) -> bool:
         transition_name: The name of the transition (e.g., "In Progress")
 
     Returns:
-        bool: True if successful, False otherwise
+        str: The status the issue had before the transition
 
     Raises:
         JiraError: If the transition cannot be performed
@@ -308,26 +500,26 @@ def transition_issue(issue_key: str, transition_name: str) -> bool:
     jira = get_jira_client()
 
     try:
-        issue = jira.issue(issue_key)
+        issue = jira.issue(issue_key, fields="project,issuetype,status")
 
-        transitions = jira.transitions(issue)
-        transition_id = None
-
-        for t in transitions:
-            if t["name"].lower() == transition_name.lower():
-                transition_id = t["id"]
-                break
+        transition_map = _get_transition_map(jira, issue)
+        transition_id = _find_transition_id(transition_map, transition_name)
+        if not transition_id:
+            # The cached map may be stale (e.g. conditions changed); check once against Jira
+            transition_map = _get_transition_map(jira, issue, refresh=True)
+            transition_id = _find_transition_id(transition_map, transition_name)
 
         if not transition_id:
-            available_transitions = ", ".join([t["name"] for t in transitions])
+            available_transitions = ", ".join(name for name, _ in transition_map.values())
             raise JiraError(
                 (
                     f"Transition '{transition_name}' not available for {issue_key}. "
                     f"Available transitions: {available_transitions}"
                 )
             )
-        jira.transition_issue(issue, transition_id)
-        return True
+        # transition_issue accepts the key, so the fetched issue is not sent back
+        jira.transition_issue(issue_key, transition_id)
+        return issue.fields.status.name
     except Exception as e:
         raise JiraError(f"Failed to transition {issue_key} to {transition_name}: {str(e)}")
 
@@ -364,6 +556,17 @@ def create_issue(project_key: str, summary: str, description: str, issue_type: s
         raise JiraError(f"Failed to create issue: {str(e)}")
 
 
+def _subtask_fields(project_key: str, parent_key: str, summary: str, description: str) -> Dict[str, Any]:
+    """Build the create fields for a subtask of parent_key."""
+    return {
+        "project": {"key": project_key},
+        "summary": summary,
+        "description": description,
+        "issuetype": {"name": "Sub-task"},
+        "parent": {"key": parent_key},
+    }
+
+
 def create_subtask(parent_key: str, summary: str, description: str) -> str:
     """
     Create a subtask for a parent issue.
@@ -382,15 +585,9 @@ def create_subtask(parent_key: str, summary: str, description: str) -> str:
     jira = get_jira_client()
 
     try:
-        parent_issue = jira.issue(parent_key)
+        parent_issue = jira.issue(parent_key, fields="project")
 
-        subtask_dict = {
-            "project": {"key": parent_issue.fields.project.key},
-            "summary": summary,
-            "description": description,
-            "issuetype": {"name": "Sub-task"},
-            "parent": {"key": parent_key},
-        }
+        subtask_dict = _subtask_fields(parent_issue.fields.project.key, parent_key, summary, description)
 
         new_subtask = jira.create_issue(fields=subtask_dict)
         return new_subtask.key
@@ -398,6 +595,52 @@ def create_subtask(parent_key: str, summary: str, description: str) -> str:
         raise JiraError(f"Failed to create subtask for {parent_key}: {str(e)}")
 
 
+def create_subtasks(parent_key: str, items: List[Tuple[str, str]]) -> List[str]:
+    """
+    Create several subtasks for a parent issue in one bulk request.
+
+    The parent is fetched once and all subtasks are sent to Jira's bulk create
+    endpoint, so splitting an issue costs two requests regardless of the count.
+
+    Like create_subtask, this is not exposed through a command or the TaskAPI yet.
+
+    Args:
+        parent_key: The parent issue key
+        items: (summary, description) pairs, one per subtask
+
+    Returns:
+        List[str]: The keys of the created subtasks, in the order of items
+
+    Raises:
+        JiraError: If the parent cannot be fetched or any subtask cannot be created
+    """
+    if not items:
+        return []
+
+    jira = get_jira_client()
+
+    try:
+        parent_issue = jira.issue(parent_key, fields="project")
+        project_key = parent_issue.fields.project.key
+
+        field_list = [
+            _subtask_fields(project_key, parent_key, summary, description) for summary, description in items
+        ]
+        results = jira.create_issues(field_list=field_list)
+    except Exception as e:
+        raise JiraError(f"Failed to create subtasks for {parent_key}: {str(e)}")
+
+    failed = [result for result in results if result["status"] != "Success"]
+    if failed:
+        created = ", ".join(result["issue"].key for result in results if result["status"] == "Success")
+        errors = "; ".join(str(result["error"]) for result in failed)
+        raise JiraError(
+            f"Failed to create {len(failed)} of {len(items)} subtasks for {parent_key}: {errors}"
+            + (f" (created: {created})" if created else "")
+        )
+    return [result["issue"].key for result in results]
+
+
 def assign_issue(issue_key: str, assignee: Optional[str] = None) -> bool:
     """
     Assign an issue to a user or to the current user if no assignee is specified.
@@ -424,12 +667,13 @@ def assign_issue(issue_key: str, assignee: Optional[str] = None) -> bool:
         raise JiraError(f"Failed to assign {issue_key}: {str(e)}")
 
 
-def search_issues(jql: str) -> List[Any]:
+def search_issues(jql: str, fields: str = _LIST_FIELDS) -> List[Any]:
     """
     Search for issues using JQL.
 
     Args:
         jql: The JQL query string
+        fields: Comma-separated list of fields to return (default: the listing fields)
 
     Returns:
         List[Any]: List of JIRA issue objects
@@ -440,124 +684,144 @@ def search_issues(jql: str) -> List[Any]:
     jira = get_jira_client()
 
     try:
-        return jira.search_issues(jql)
+        return jira.search_issues(jql, maxResults=_PAGE_SIZE, fields=fields)
     except Exception as e:
         raise JiraError(f"Failed to search issues: {str(e)}")
 
 
-def get_worked_on_issues(date_str: str = None) -> List[Any]:
+def _unique_issues(issue_lists: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
     """
-    Get issues that were worked on by the current user on a specific date.
+    Yield each issue once, in first-seen order, from a stream of issue lists.
 
     Args:
-        date_str: Date string in YYYY-MM-DD format (default: today)
+        issue_lists: Iterable of raw JIRA issue dict lists, consumed lazily
 
-    Returns:
-        List[Any]: List of JIRA issue objects
+    Yields:
+        Dict[str, Any]: The first occurrence of each issue key
+    """
+    seen = set()
+    for issues in issue_lists:
+        for issue in issues:
+            if issue["key"] not in seen:
+                seen.add(issue["key"])
+                yield issue
 
-    Raises:
-        JiraError: If the search fails
+
+# Jira timestamps such as "2024-01-15T10:23:45.000+0100"
+_JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _updated_at(issue: Dict[str, Any]) -> datetime:
     """
-    from datetime import date, datetime, timedelta
+    Parse an issue's updated timestamp so issues with different UTC offsets compare correctly.
 
-    jira = get_jira_client()
+    Args:
+        issue: Raw JIRA issue dict fetched with the updated field
 
+    Returns:
+        datetime: The timezone-aware update time, or the earliest datetime if it is missing or unparsable
+    """
     try:
-        if not date_str:
-            target_date = date.today().strftime("%Y-%m-%d")
-        else:
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-                target_date = date_str
-            except ValueError:
-                raise JiraError(f"Invalid date format: {date_str}. Please use YYYY-MM-DD format.")
+        return datetime.strptime(issue["fields"].get("updated") or "", _JIRA_TIMESTAMP_FORMAT)
+    except ValueError:
+        return _EPOCH
 
-        parsed_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        next_day = (parsed_date + timedelta(days=1)).strftime("%Y-%m-%d")
 
-        logger.info(f"Searching for issues worked on between {target_date} and {next_day}")
+def get_worked_on_issues(date_str: str = None) -> List[Dict[str, Any]]:
+    """
+    Get issues that were worked on by the current user on a specific date.
 
-        all_issues = []
+    Args:
+        date_str: Date string in YYYY-MM-DD format (default: today)
 
-        jql = f"worklogDate = {target_date} AND worklogAuthor = currentUser() ORDER BY updated DESC"
-        logger.info(f"Executing JQL: {jql}")
-        worklog_issues = jira.search_issues(jql)
-        logger.info(f"Found {len(worklog_issues)} issues with worklog entries")
-        all_issues.extend([issue.key for issue in worklog_issues])
+    Returns:
+        List[Dict[str, Any]]: List of raw JIRA issue dicts
 
-        jql = (
-            f"assignee = currentUser() AND updated >= '{target_date} 00:00' "
-            f"AND updated <= '{target_date} 23:59' ORDER BY updated DESC"
-        )
-        logger.info(f"Executing JQL: {jql}")
-        updated_issues = jira.search_issues(jql)
-        logger.info(f"Found {len(updated_issues)} issues updated on this date")
-        all_issues.extend([issue.key for issue in updated_issues if issue.key not in all_issues])
+    Raises:
+        JiraError: If the search fails
+    """
+    jira = get_jira_client()
 
-        jql = (
-            f"assignee = currentUser() AND status CHANGED DURING ('{target_date} 00:00', "
-            f"'{target_date} 23:59') ORDER BY updated DESC"
-        )
-        logger.info(f"Executing JQL: {jql}")
-        status_changed_issues = jira.search_issues(jql)
-        logger.info(f"Found {len(status_changed_issues)} issues with status changes")
-        all_issues.extend([issue.key for issue in status_changed_issues if issue.key not in all_issues])
+    try:
+        # Parse the date once; both the JQL date and the next day derive from it
+        try:
+            parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date() if date_str else date.today()
+        except ValueError:
+            raise JiraError(f"Invalid date format: {date_str}. Please use YYYY-MM-DD format.")
+        target_date = parsed_date.isoformat()
+        next_day = (parsed_date + timedelta(days=1)).isoformat()
 
-        jql = f"assignee = currentUser() AND (status WAS 'In Progress' ON '{target_date}' OR status WAS 'Work in progress' ON '{target_date}') ORDER BY updated DESC"
-        logger.info(f"Executing JQL: {jql}")
-        in_progress_issues = jira.search_issues(jql)
-        logger.info(f"Found {len(in_progress_issues)} issues that were In Progress on this date")
-        all_issues.extend([issue.key for issue in in_progress_issues if issue.key not in all_issues])
+        logger.info(f"Searching for issues worked on between {target_date} and {next_day}")
 
-        jql = (
-            f"assignee = currentUser() AND assignee CHANGED DURING ('{target_date} 00:00', "
-            f"'{target_date} 23:59') ORDER BY updated DESC"
-        )
-        logger.info(f"Executing JQL: {jql}")
-        assigned_issues = jira.search_issues(jql)
-        logger.info(f"Found {len(assigned_issues)} issues assigned on this date")
-        all_issues.extend([issue.key for issue in assigned_issues if issue.key not in all_issues])
+        probes = [(description, template.format(date=target_date)) for description, template in _WORKED_ON_PROBES]
+        comment_jql = _COMMENTED_JQL.format(date=target_date)
 
-        jql = (
-            f'issueFunction in commented(\'by currentUser() after "{target_date} 00:00" '
-            f'before "{target_date} 23:59"\') ORDER BY updated DESC'
-        )
-        try:
-            logger.info(f"Executing JQL for comments: {jql}")
-            commented_issues = jira.search_issues(jql, maxResults=50)
-            logger.info(f"Found {len(commented_issues)} issues potentially commented on (using issueFunction)")
-            all_issues.extend([issue.key for issue in commented_issues if issue.key not in all_issues])
-        except Exception as e:
-            logger.warning(
-                f"Could not execute JQL for commented issues: {e}. "
-                f"This might be due to missing JQL functions (like issueFunction). Skipping this check."
-            )
+        def run_probe(jql: str) -> List[Dict[str, Any]]:
+            logger.info(f"Executing JQL: {jql}")
+            return _search_issues_paged(jira, jql, _WORKED_ON_FIELDS, _PROBE_MAX_RESULTS)
 
-        if all_issues:
-            unique_issues = []
-            for key in all_issues:
-                if key not in unique_issues:
-                    unique_issues.append(key)
-
-            logger.info(f"Found {len(unique_issues)} unique issues in total")
-
-            if unique_issues:
-                jql = f"key in ({','.join(unique_issues)}) AND status != 'To Do' ORDER BY updated DESC"
-                logger.info(f"Fetching full details with JQL: {jql}")
-                issues = jira.search_issues(jql)
-                logger.info(f"Successfully fetched {len(issues)} issues with full details")
-            else:
-                issues = []
+        def run_comment_probe() -> List[Dict[str, Any]]:
+            # issueFunction needs ScriptRunner and scans the comment index; only run it when enabled
+            if not _scriptrunner_enabled():
+                return []
+            try:
+                logger.info(f"Executing JQL for comments: {comment_jql}")
+                return _search_issues_paged(jira, comment_jql, _WORKED_ON_FIELDS, 50)
+            except Exception as e:
+                logger.warning(
+                    f"Could not execute JQL for commented issues: {e}. "
+                    f"This might be due to missing JQL functions (like issueFunction). Skipping this check."
+                )
+                return []
+
+        # Logged work is the authoritative signal, so try the worklogDate probe on its own first
+        (worklog_description, worklog_jql), fallback_probes = probes[0], probes[1:]
+        worklog_issues = run_probe(worklog_jql)
+        logger.info(f"Found {len(worklog_issues)} {worklog_description}")
+
+        def filter_issues(found_issue_lists) -> List[Dict[str, Any]]:
+            # The probes already returned the listing fields, so deduplicate and filter here
+            # instead of fetching the merged keys again; only first occurrences are kept
+            return [
+                issue
+                for issue in _unique_issues(found_issue_lists)
+                # Compare case-insensitively, as the JQL status filter this replaced did
+                if issue["fields"]["status"]["name"].casefold() != "to do"
+            ]
+
+        # A capped result may be incomplete, so only trust it below the probe limit
+        if _MIN_CONFIDENT_WORKLOG_ISSUES <= len(worklog_issues) < _PROBE_MAX_RESULTS:
+            logger.info("Work was logged on this date; skipping the fallback probes")
+            issues = filter_issues([worklog_issues])
         else:
+            # The fallback probes are independent round-trips, so run them concurrently; results
+            # are streamed through the deduplication in probe order as each one completes
+            with ThreadPoolExecutor(max_workers=len(fallback_probes) + 1) as executor:
+                probe_futures = [executor.submit(run_probe, jql) for _, jql in fallback_probes]
+                comment_future = executor.submit(run_comment_probe)
+
+                def probe_results() -> Iterator[List[Dict[str, Any]]]:
+                    yield worklog_issues
+                    for (description, _), future in zip(fallback_probes, probe_futures):
+                        found_issues = future.result()
+                        logger.info(f"Found {len(found_issues)} {description}")
+                        yield found_issues
+                    commented_issues = comment_future.result()
+                    if _scriptrunner_enabled():
+                        logger.info(
+                            f"Found {len(commented_issues)} issues potentially commented on (using issueFunction)"
+                        )
+                    yield commented_issues
+
+                issues = filter_issues(probe_results())
+
+        issues.sort(key=_updated_at, reverse=True)
+        logger.info(f"Found {len(issues)} unique issues in total")
+        if not issues:
             logger.info("No issues found across all search methods")
-            issues = []
 
-        for issue in issues:
-            try:
-                issue.worklog_seconds = get_issue_worklog_time(issue.key)
-            except Exception as e:
-                logger.error(f"Error fetching worklog for {issue.key}: {str(e)}")
-                issue.worklog_seconds = 0
+        _attach_worklog_seconds(issues)
 
         return issues
     except Exception as e:
@@ -580,9 +844,8 @@ def get_available_transitions(issue_key: str) -> List[str]:
     jira = get_jira_client()
 
     try:
-        issue = jira.issue(issue_key)
-        transitions = jira.transitions(issue)
-        return [t["name"] for t in transitions]
+        issue = jira.issue(issue_key, fields="project,issuetype,status")
+        return [name for name, _ in _get_transition_map(jira, issue).values()]
     except Exception as e:
         raise JiraError(f"Failed to get transitions for {issue_key}: {str(e)}")
 
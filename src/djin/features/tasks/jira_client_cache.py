@@ -0,0 +1,67 @@
+"""
+Short-lived cache for Jira lookups used by the task workflow.
+
+This module wraps the read functions in jira_client with a small in-process TTL cache,
+so repeated listings and detail views within an interactive session do not hit the
+Jira REST API again. Mutating calls invalidate the affected entries.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from djin.common.cache import SingleFlight, TTLCache
+from djin.features.tasks import jira_client
+
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_SIZE = 256
+
+_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
+_flight = SingleFlight()
+
+
+def _cached(key: Tuple[Any, ...], fetch: Callable[[], Any]) -> Any:
+    """Return the cached value for key; concurrent misses for the same key share one fetch."""
+    return _cache.get_or_set(key, lambda: _flight.do(key, fetch))
+
+
+def clear_cache() -> None:
+    """Remove all cached Jira lookups."""
+    _cache.clear()
+
+
+def invalidate_issue(issue_key: str) -> None:
+    """Drop the cached details for an issue along with all cached issue listings."""
+    _cache.discard_where(lambda key: key[0] != "get_issue_details" or key[1] == issue_key)
+
+
+def get_my_issues(status_filter: Optional[str] = None) -> List[Any]:
+    """Cached version of jira_client.get_my_issues."""
+    return _cached(("get_my_issues", status_filter), lambda: jira_client.get_my_issues(status_filter=status_filter))
+
+
+def get_my_completed_issues(days: int = 7) -> List[Any]:
+    """Cached version of jira_client.get_my_completed_issues."""
+    return _cached(("get_my_completed_issues", days), lambda: jira_client.get_my_completed_issues(days=days))
+
+
+def get_worked_on_issues(date_str: Optional[str] = None) -> List[Any]:
+    """Cached version of jira_client.get_worked_on_issues."""
+    return _cached(("get_worked_on_issues", date_str), lambda: jira_client.get_worked_on_issues(date_str))
+
+
+def get_issue_details(issue_key: str) -> Dict[str, Any]:
+    """Cached version of jira_client.get_issue_details; returns a copy callers may modify."""
+    return dict(_cached(("get_issue_details", issue_key), lambda: jira_client.get_issue_details(issue_key)))
+
+
+def transition_issue(issue_key: str, transition_name: str) -> str:
+    """Transition an issue, invalidate the cached entries it affects and return its previous status."""
+    old_status = jira_client.transition_issue(issue_key, transition_name)
+    invalidate_issue(issue_key)
+    return old_status
+
+
+def create_issue(project_key: str, summary: str, description: str, issue_type: str = "Task") -> str:
+    """Create an issue and invalidate the cached issue listings."""
+    new_issue_key = jira_client.create_issue(project_key, summary, description, issue_type)
+    invalidate_issue(new_issue_key)
+    return new_issue_key
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Model representing a task."""
 
@@ -26,7 +26,7 @@ class Task:
     due_date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSummary:
     """Model representing a summary of tasks."""
 
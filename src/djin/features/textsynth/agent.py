@@ -4,11 +4,11 @@ Report and text synthesis agent for Djin.
 This module provides an agent specialized in report generation and text synthesis.
 """
 
+import functools
 import logging
 from typing import List  # Added Dict, Any
 
 from djin.common.errors import DjinError
-from djin.features.textsynth.graph.workflow import create_title_summarization_graph
 
 # Set up logging
 logger = logging.getLogger("djin.textsynth")
@@ -17,10 +17,13 @@ logger = logging.getLogger("djin.textsynth")
 class TextSynthAgent:
     """Agent specialized in text synthesis operations like summarization."""
 
-    def __init__(self):
-        """Initialize the text synthesis agent."""
-        # Only initialize what's needed for the remaining methods
-        self._title_summarization_graph = create_title_summarization_graph()
+    @functools.cached_property
+    def _title_summarization_graph(self):
+        """The title summarization workflow, built on first use rather than at construction."""
+        # Imported here so creating the agent does not load LangGraph and the LLM client
+        from djin.features.textsynth.graph.workflow import get_title_summarization_graph
+
+        return get_title_summarization_graph()
 
     def summarize_titles_with_keys(self, keys: List[str], titles: List[str]) -> str:
         """
@@ -39,6 +42,12 @@ class TextSynthAgent:
         if len(keys) != len(titles):
             raise DjinError("Number of keys and titles must match for summarization.")
 
+        # Nothing to summarize for zero or one item; skip the workflow and its LLM round-trip
+        if not titles:
+            return ""
+        if len(titles) == 1:
+            return f"Worked on {titles[0]} ({keys[0]})."
+
         try:
             logger.info(f"Summarizing {len(titles)} Jira issues (keys and titles)")
 
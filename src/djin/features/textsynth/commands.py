@@ -2,12 +2,12 @@
 Command handlers for report generation and text synthesis.
 """
 
+import functools
 import logging
 
 from rich.console import Console
 from rich.panel import Panel
 
-from djin.cli.commands import register_command
 from djin.features.textsynth.agent import TextSynthAgent
 
 # Set up logging
@@ -15,11 +15,12 @@ logger = logging.getLogger("djin.textsynth.commands")
 
 # Create console for rich output
 console = Console()
-# Create text synthesis agent
-textsynth_agent = TextSynthAgent()
 
-# Log that commands are being registered
-logger.info("Registering textsynth commands")
+
+@functools.lru_cache(maxsize=1)
+def _get_textsynth_agent() -> TextSynthAgent:
+    """Create the text synthesis agent on first use instead of at import."""
+    return TextSynthAgent()
 
 
 def summarize_titles_command(args):
@@ -34,7 +35,7 @@ def summarize_titles_command(args):
         titles = args
 
         # Generate summary
-        summary = textsynth_agent.summarize_titles(titles)
+        summary = _get_textsynth_agent().summarize_titles(titles)
 
         # Display summary
         console.print(Panel(summary, title="Title Summary", border_style="green"))
@@ -43,17 +44,3 @@ def summarize_titles_command(args):
     except Exception as e:
         console.print(f"[red]Error summarizing titles: {str(e)}[/red]")
         return False
-
-
-def register_textsynth_commands():
-    """Registers all commands related to the textsynth feature."""
-    commands_to_register = {
-        "summarize": (
-            summarize_titles_command,
-            "Summarize multiple Jira issue titles. Usage: /summarize 'Title 1' 'Title 2' ...",
-        ),
-        # Removed report commands: "report daily", "report weekly", "report custom"
-    }
-    for name, (func, help_text) in commands_to_register.items():
-        register_command(name, func, help_text)
-    logger.info(f"Textsynth commands registered: {list(commands_to_register.keys())}")
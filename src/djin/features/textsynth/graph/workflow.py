@@ -4,9 +4,11 @@ Workflows for text synthesis.
 This module provides workflows for text synthesis operations.
 """
 
+import functools
+
 from langgraph.graph import StateGraph
 
-from djin.features.textsynth.graph.nodes import prepare_titles_node, summarize_titles_node
+from djin.features.textsynth.graph.nodes import summarize_titles_node
 from djin.features.textsynth.graph.state import SummarizeTitlesState
 
 
@@ -19,13 +21,17 @@ def create_title_summarization_graph():
     """
     graph = StateGraph(SummarizeTitlesState)
 
-    graph.add_node("prepare_titles", prepare_titles_node)
+    # Validation and summarization share one node: one state transition, one LLM call
     graph.add_node("summarize_titles", summarize_titles_node)
-    # Add edges
-    graph.add_edge("prepare_titles", "summarize_titles")
 
     # Set entry point
-    graph.set_entry_point("prepare_titles")
+    graph.set_entry_point("summarize_titles")
 
     # Compile the graph
     return graph.compile()
+
+
+@functools.cache
+def get_title_summarization_graph():
+    """Return the compiled title summarization graph, building it on first use"""
+    return create_title_summarization_graph()
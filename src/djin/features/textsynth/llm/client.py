@@ -3,19 +3,67 @@ ABOUTME: LLM client for text synthesis and summarization.
 ABOUTME: Uses Groq-hosted models via LangChain to summarize work items.
 """
 
+import functools
 import os
-from typing import List
+from typing import Dict, List, Tuple
 
 from loguru import logger
 
-from dotenv import load_dotenv
-from langchain_core.prompts import PromptTemplate
-from langchain_groq import ChatGroq
-
+from djin.common.cache import TTLCache
 from djin.common.errors import DjinError
-from djin.features.textsynth.llm.prompts import SUMMARIZE_TITLES_PROMPT
+from djin.features.textsynth.llm.prompts import render_summarize_titles
+
+# Summaries are cached per exact set of work items, so re-running a summary for the same
+# day does not cost another LLM round trip
+SUMMARY_CACHE_TTL_SECONDS = 12 * 60 * 60
+SUMMARY_CACHE_MAX_SIZE = 512
+
+_summary_cache = TTLCache(maxsize=SUMMARY_CACHE_MAX_SIZE, ttl=SUMMARY_CACHE_TTL_SECONDS)
+
+# Upper bound on distinct work items listed in a prompt; the rest are folded into one line
+MAX_PROMPT_WORK_ITEMS = 200
+
+
+def _normalize_title(title: str) -> str:
+    """Case-fold a title and collapse its whitespace so near-identical titles compare equal."""
+    return " ".join(title.lower().split())
+
+
+def _format_work_items(keys: List[str], titles: List[str]) -> str:
+    """
+    Format work items for the prompt, listing each distinct title once with all of its keys.
+
+    Jira often carries the same title on several issues (e.g. one per epic); sending it once
+    keeps the prompt short while every key stays available for the summary to cite.
+    Beyond MAX_PROMPT_WORK_ITEMS distinct titles, the remainder is reduced to a count and a
+    few example keys so the prompt stays within the model's context.
+    """
+    keys_by_title: Dict[str, List[str]] = {}
+    first_titles: Dict[str, str] = {}
+    for key, title in zip(keys, titles):
+        normalized = _normalize_title(title)
+        keys_by_title.setdefault(normalized, []).append(key)
+        first_titles.setdefault(normalized, title)
+    items = list(keys_by_title.items())
+    lines = [f"- {', '.join(item_keys)}: {first_titles[n]}" for n, item_keys in items[:MAX_PROMPT_WORK_ITEMS]]
+    if len(items) > MAX_PROMPT_WORK_ITEMS:
+        omitted_keys = [item_keys[0] for _, item_keys in items[MAX_PROMPT_WORK_ITEMS:]]
+        lines.append(f"- {len(omitted_keys)} more work items, including {', '.join(omitted_keys[:3])}")
+    return "\n".join(lines)
 
-load_dotenv()
+
+def _summary_cache_key(model: str, keys: List[str], titles: List[str]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Build an order-insensitive cache key from the model and the normalized key/title pairs."""
+    items = sorted((key.strip().upper(), _normalize_title(title)) for key, title in zip(keys, titles))
+    return model, tuple(items)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once, when the first client is created rather than at import."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 class TextSynthLLMClient:
@@ -30,6 +78,10 @@ class TextSynthLLMClient:
         """
         self.model = model
 
+        # LangChain and the Groq SDK are only imported once an LLM client is actually needed
+        from langchain_groq import ChatGroq
+
+        _load_env()
         api_key = os.environ.get("GROQ_API_KEY")
         if not api_key:
             logger.warning("GROQ_API_KEY not found in environment variables")
@@ -53,20 +105,31 @@ class TextSynthLLMClient:
         if len(keys) != len(titles):
             raise DjinError("Number of keys and titles must match for summarization.")
 
+        cache_key = _summary_cache_key(self.model, keys, titles)
+        return _summary_cache.get_or_set(cache_key, lambda: self._summarize_uncached(keys, titles))
+
+    def _summarize_uncached(self, keys: List[str], titles: List[str]) -> str:
+        """Ask the LLM to summarize the work items; see summarize_titles_with_keys."""
         try:
-            logger.info(f"Summarizing {len(titles)} work items (keys and titles)")
+            logger.info("Summarizing {} work items (keys and titles)", len(titles))
 
-            issues_str = "\n".join([f"- {key}: {title}" for key, title in zip(keys, titles)])
+            issues_str = _format_work_items(keys, titles)
 
-            prompt_template = PromptTemplate.from_template(SUMMARIZE_TITLES_PROMPT)
-            prompt = prompt_template.format(issues=issues_str)
+            prompt = render_summarize_titles(issues_str)
 
             response = self.llm.invoke(prompt)
 
             summary = response.content.strip()
-            logger.info(f"Generated summary: {summary}")
+            # Full text at DEBUG; loguru only formats the message if a sink accepts the record
+            logger.debug("Generated summary: {}", summary)
 
             return summary
         except Exception as e:
             logger.error(f"Error in summarize_titles_with_keys: {str(e)}")
             raise DjinError(f"Failed to summarize work items: {str(e)}")
+
+
+@functools.lru_cache(maxsize=4)
+def get_textsynth_client(model: str = "openai/gpt-oss-120b") -> TextSynthLLMClient:
+    """Return the shared client for a model, so its Groq HTTP connection pool survives across calls."""
+    return TextSynthLLMClient(model)
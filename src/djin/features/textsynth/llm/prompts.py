@@ -1,17 +1,16 @@
 """
 ABOUTME: Prompt templates for text synthesis operations.
-ABOUTME: Contains prompts for summarizing work items and generating reports.
+ABOUTME: Contains the prompt for summarizing work items.
 """
 
-# Prompt for summarizing multiple work item titles including their keys
-SUMMARIZE_TITLES_PROMPT = """
+# Prompt for summarizing multiple work item titles including their keys.
+# All static instructions come first and the work items last, so the provider's prompt
+# cache can reuse the identical prefix across calls.
+SUMMARIZE_TITLES_PROMPT = """\
 You are an assistant that summarizes multiple work items into a concise, action-oriented summary.
-Given the following work items (Key: Title format), create a brief summary that describes what was worked on,
+Given a list of work items (Key: Title format), create a brief summary that describes what was worked on,
 as if you're reporting on completed or ongoing work.
 
-Work Items:
-{issues}
-
 Your summary should:
 1. Begin with phrases like "Worked on" or "Made progress on".
 2. Be concise (1 sentence only).
@@ -31,70 +30,16 @@ Work Items:
 Example Output:
 Worked on fixing a login bug (TASK-1), implementing the new dashboard (FEAT-2), and updating the data pipeline (DA-42).
 
-Summary:
-"""
-
-# Prompt for generating a daily report
-DAILY_REPORT_PROMPT = """
-You are an assistant that generates daily work reports. Given the following lists of
- active and completed tasks for {date}, generate a professional daily report.
-
-Active Tasks:
-{active_tasks}
-
-Completed Tasks:
-{completed_tasks}
-
-Your report should:
-1. Summarize completed work with specific accomplishments
-2. Describe ongoing work and its current status
-3. Be written in a professional, first-person style suitable for a daily status report
-4. Be concise but comprehensive
-
-Daily Report:
-"""
-
-# Prompt for generating a weekly report
-WEEKLY_REPORT_PROMPT = """
-You are an assistant that generates weekly work reports. Given the following lists of
- active and completed tasks for the week of {start_date} to {end_date}, generate a professional weekly report.
-
-Active Tasks:
-{active_tasks}
-
-Completed Tasks:
-{completed_tasks}
-
-Your report should:
-1. Summarize completed work with specific accomplishments
-2. Describe ongoing work and its current status
-3. Group related tasks together
-4. Highlight key achievements and milestones
-5. Be written in a professional, first-person style suitable for a weekly status report
-6. Be concise but comprehensive
+Work Items:
+{issues}
 
-Weekly Report:
+Summary:
 """
 
-# Prompt for generating a custom report
-CUSTOM_REPORT_PROMPT = """
-You are an assistant that generates work reports. Given the following lists of
- active and completed tasks for the period of {start_date} to {end_date} ({days} days),
- generate a professional report.
-
-Active Tasks:
-{active_tasks}
+# Split once at import around the single placeholder, so rendering is plain concatenation
+_SUMMARIZE_TITLES_HEAD, _, _SUMMARIZE_TITLES_TAIL = SUMMARIZE_TITLES_PROMPT.partition("{issues}")
 
-Completed Tasks:
-{completed_tasks}
 
-Your report should:
-1. Summarize completed work with specific accomplishments
-2. Describe ongoing work and its current status
-3. Group related tasks together
-4. Highlight key achievements and milestones
-5. Be written in a professional, first-person style suitable for a status report
-6. Be concise but comprehensive
-
-Report:
-"""
+def render_summarize_titles(issues: str) -> str:
+    """Fill SUMMARIZE_TITLES_PROMPT with the formatted work item lines."""
+    return _SUMMARIZE_TITLES_HEAD + issues + _SUMMARIZE_TITLES_TAIL
@@ -2,49 +2,109 @@
 Djin - A magical terminal assistant for developers.
 """
 
-import argparse
+import os
 import sys
+from types import SimpleNamespace
 
-from loguru import logger  # Import Loguru logger
-from rich.console import Console
+# Loguru and the djin.common modules (which create their own Rich consoles) are imported
+# inside the functions below, so they are only loaded on the paths that use them
 
-from djin.cli.app import main_loop
-from djin.common.config import is_configured, setup_config
-from djin.common.errors import (
-    LOG_DIR,
-    LOG_FILE,  # Import log path constants
-    handle_error,
-)
+# ANSI codes for the few colored status lines printed here; main.py does not need Rich
+_ANSI_COLORS = {"green": "32", "yellow": "33"}
 
-# Create console for rich output
-console = Console()
 
+def _cprint(message, color=None):
+    """Print a status line, colored only when stdout is a terminal and NO_COLOR is unset."""
+    if color and sys.stdout.isatty() and "NO_COLOR" not in os.environ:
+        message = f"\x1b[{_ANSI_COLORS[color]}m{message}\x1b[0m"
+    sys.stdout.write(message + "\n")
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Djin - A magical terminal assistant for developers",
-        epilog="Type '/help' within the application for more information.",
-    )
 
-    # Setup command
-    parser.add_argument("--setup", action="store_true", help="Run initial setup")
+_USAGE = "usage: djin [-h] [--setup] [--reset-db] [--backup-db] [--yes]"
+
+_HELP = f"""{_USAGE}
+
+Djin - A magical terminal assistant for developers
+
+options:
+  -h, --help   show this help message and exit
+  --setup      Run initial setup
+  --reset-db   Reset the database (WARNING: This will delete all data)
+  --backup-db  Create a backup of the database
+  --yes        Answer yes to confirmation prompts (for scripted use)
+
+Type '/help' within the application for more information.
+"""
+
+# Command line flag -> attribute name on the parsed arguments
+_FLAGS = {"--setup": "setup", "--reset-db": "reset_db", "--backup-db": "backup_db", "--yes": "yes"}
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments; djin only takes a few boolean flags, so no argparse is needed."""
+    args = SimpleNamespace(**{name: False for name in _FLAGS.values()})
+    for arg in sys.argv[1:] if argv is None else argv:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        name = _FLAGS.get(arg)
+        if name is None:
+            sys.stderr.write(f"{_USAGE}\ndjin: error: unrecognized arguments: {arg}\n")
+            sys.exit(2)
+        setattr(args, name, True)
+    return args
+
+
+def _setup_command(args):
+    """Run the interactive setup."""
+    from djin.common.config import setup_config
+
+    setup_config()
+    _cprint("Setup complete! You can now run Djin.", "green")
 
-    # Reset database
-    parser.add_argument(
-        "--reset-db",
-        action="store_true",
-        help="Reset the database (WARNING: This will delete all data)",
-    )
 
-    # Backup database
-    parser.add_argument("--backup-db", action="store_true", help="Create a backup of the database")
+def _reset_db_command(args):
+    """Reset the database after confirmation, unless --yes was given."""
+    from djin.features.notes.db.schema import reset_database
 
-    return parser.parse_args()
+    if args.yes:
+        confirmed = True
+    else:
+        confirm = input("WARNING: This will delete all data in the Djin database. Continue? (y/N): ")
+        confirmed = confirm.strip().lower() in ("y", "yes")
+    if confirmed:
+        reset_database()
+        _cprint("Database reset complete.", "green")
+    else:
+        _cprint("Database reset cancelled.", "yellow")
+
+
+def _backup_db_command(args):
+    """Create a backup of the database."""
+    from djin.features.notes.db.schema import backup_database
+
+    backup_file = backup_database()
+    if backup_file:
+        _cprint(f"Database backed up to {backup_file}", "green")
+    else:
+        _cprint("No database found to back up.", "yellow")
+
+
+# Flags that run a one-off command and exit instead of starting the REPL; each handler
+# receives the parsed arguments and imports what it needs itself
+_FLAG_COMMANDS = {
+    "setup": _setup_command,
+    "reset_db": _reset_db_command,
+    "backup_db": _backup_db_command,
+}
 
 
 def configure_logging():
     """Configure Loguru sinks."""
+    from loguru import logger
+
+    from djin.common.errors import LOG_DIR, LOG_FILE
+
     # Ensure log directory exists
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -63,39 +123,45 @@ def configure_logging():
         retention="1 week",  # Keep logs for 1 week
         compression="zip",  # Compress rotated files
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        colorize=True,  # Added colorize=True for file logging
-        # Use enqueue=True for async logging if needed, especially in threaded/multi-process apps
-        # enqueue=True,
+        # Write and rotate/compress on loguru's background worker instead of the calling thread
+        enqueue=True,
     )
     logger.info(f"Logging configured. File logging level: DEBUG at {LOG_FILE}")
 
 
 def main():
-    # --- Configure Logging FIRST ---
+    # Parse command line arguments first; --help and bad flags exit here before any
+    # logging or feature setup
+    args = parse_arguments()
+
+    # --- Configure Logging before anything that logs ---
     configure_logging()
     # -------------------------------
-    try:
-        # Parse command line arguments
-        args = parse_arguments()
+    from djin.common.config import is_configured, setup_config
+    from djin.common.errors import handle_error
 
-        # Handle setup command
-        if args.setup:
-            setup_config()
-            console.print("[green]Setup complete! You can now run Djin.[/green]")
-            return 0
+    try:
+        # Handle one-off flag commands
+        for flag, command in _FLAG_COMMANDS.items():
+            if getattr(args, flag):
+                command(args)
+                return 0
 
         # Check if configured
         if not is_configured():
-            console.print("[yellow]Djin is not configured yet. Running setup...[/yellow]")
+            _cprint("Djin is not configured yet. Running setup...", "yellow")
             setup_config()
 
-        # Start the main application loop
+        # Start the main application loop; the REPL and its feature modules are only
+        # imported here, so --setup and --help do not load them
+        from djin.cli.app import main_loop
+
         main_loop()
 
         return 0
 
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        _cprint("\nOperation cancelled by user.", "yellow")
         return 0
     except Exception as e:
         handle_error(e)